@@ -19,84 +19,562 @@ Representations:
                     C → [A,D]
                     D → [B,C,A]
 
+2. Compressed Sparse Row (CSR):
+   offsets   = [0, 3, 5, 7, 10]          A's neighbors live in
+   neighbors = [1,2,3, 0,3, 0,3, 1,2,0]  neighbors[offsets[0]:offsets[1]]
+
 Operations:
 - add_vertex(v)     : Add new vertex
-- add_edge(v1, v2)  : Connect vertices
-- remove_vertex(v)  : Remove vertex
-- remove_edge(v1,v2): Remove connection
+- add_edge(v1, v2)  : Connect vertices (optional weight=)
+- remove_vertex(v)  : Remove vertex and its edges
+- remove_edge(v1,v2): Remove connection (O(1) with adjacency="dict")
+- freeze()          : Immutable CSR snapshot (NumPy)
+- connected(v1, v2) : Same component? (union-find, near O(1))
+- ParallelBFS(csr)  : Level-synchronous BFS across a process pool
+- from_edge_list(p) : Bulk-load an edge-list file; CSRGraph.save/load binary snapshots
 """
 
-from collections import defaultdict, deque
+import heapq
+import itertools
+import math
+import mmap
+import multiprocessing
+import os
+import struct
+import time
+from collections import Counter, defaultdict, deque
+from collections.abc import Sequence
+from multiprocessing import shared_memory
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+class DisjointSet:
+    """Union-find with path compression and union by rank: near-O(1) amortized per operation"""
+
+    def __init__(self):
+        self.parent = {}
+        self.rank = {}
+        self.size = {}
+        self.count = 0
+
+    def add(self, item):
+        if item not in self.parent:
+            self.parent[item] = item
+            self.rank[item] = 0
+            self.size[item] = 1
+            self.count += 1
+
+    def find(self, item):
+        root = item
+        while self.parent[root] != root:
+            root = self.parent[root]
+        # Path compression: point everything on the walk straight at the root
+        while self.parent[item] != root:
+            self.parent[item], item = root, self.parent[item]
+        return root
+
+    def union(self, item1, item2):
+        root1, root2 = self.find(item1), self.find(item2)
+        if root1 == root2:
+            return False
+        if self.rank[root1] < self.rank[root2]:
+            root1, root2 = root2, root1
+        self.parent[root2] = root1
+        self.size[root1] += self.size.pop(root2)
+        if self.rank[root1] == self.rank[root2]:
+            self.rank[root1] += 1
+        del self.rank[root2]
+        self.count -= 1
+        return True
 
 class Graph:
-    def __init__(self, directed=False):
-        self.graph = defaultdict(list)
-        self.directed = directed
+    def __init__(self, directed=False, adjacency="list"):
+        # adjacency="list": graph[v] is a list of neighbors (one entry per parallel edge)
+        # adjacency="dict": graph[v] maps neighbor -> edge multiplicity, for O(1) edge removal
+        if adjacency not in ("list", "dict"):
+            raise ValueError("adjacency must be 'list' or 'dict'")
+        self.adjacency = adjacency
+        self.graph = defaultdict(list if adjacency == "list" else dict)
+        self._edge_count = None                # list mode: v1 -> {v2: times v2 appears in graph[v1]}, see _list_counts
+        self._predecessors = defaultdict(set)  # dict mode, directed: vertex -> vertices with an edge into it
+        self._weights = defaultdict(dict)      # vertex -> {neighbor: weight}, only for weights other than 1
+        self._directed = directed
+        # Connected components (weak, for directed graphs), kept up to date by add_edge;
+        # removals only mark them stale and the next query rebuilds them
+        self._components = DisjointSet()
+        self._components_stale = False
+
+    @property
+    def directed(self):
+        return self._directed
+
+    @directed.setter
+    def directed(self, directed):
+        self._directed = directed
+        self._predecessors.clear()
+        if directed and self.adjacency == "dict":
+            for vertex, neighbors in self.graph.items():
+                for neighbor in neighbors:
+                    self._predecessors[neighbor].add(vertex)
 
     def add_vertex(self, vertex):
         if vertex not in self.graph:
-            self.graph[vertex] = []
+            self.graph[vertex] = self.graph.default_factory()
+            if self._edge_count is not None:
+                self._edge_count[vertex] = {}
+            if not self._components_stale:
+                self._components.add(vertex)
 
-    def add_edge(self, vertex1, vertex2):
+    def add_edge(self, vertex1, vertex2, weight=1):
         if vertex1 not in self.graph:
             self.add_vertex(vertex1)
         if vertex2 not in self.graph:
             self.add_vertex(vertex2)
-            
+        if not self._components_stale:
+            self._components.union(vertex1, vertex2)
+
+        self._set_weight(vertex1, vertex2, weight)
+        if not self.directed:
+            self._set_weight(vertex2, vertex1, weight)
+        if self.adjacency == "dict":
+            self._link(vertex1, vertex2)
+            if not self.directed:
+                self._link(vertex2, vertex1)
+            return
+
         self.graph[vertex1].append(vertex2)
         if not self.directed:
             self.graph[vertex2].append(vertex1)
+        counts = self._edge_count
+        if counts is not None:
+            counts[vertex1][vertex2] = counts[vertex1].get(vertex2, 0) + 1
+            if not self.directed:
+                counts[vertex2][vertex1] = counts[vertex2].get(vertex1, 0) + 1
+
+    def _list_counts(self):
+        # list mode's edge index, built on the first edge lookup: graphs that only add edges
+        # and traverse never allocate it, and once built add_edge keeps it current
+        if self._edge_count is None:
+            self._edge_count = {vertex: dict(Counter(neighbors)) for vertex, neighbors in self.graph.items()}
+        return self._edge_count
+
+    def _set_weight(self, vertex1, vertex2, weight):
+        # Parallel edges share one weight: the smallest, which is all shortest paths need
+        if weight == 1 and vertex2 not in self._weights.get(vertex1, ()):
+            return  # unweighted edge and no stored weight to lower: nothing to look up
+        if self.has_edge(vertex1, vertex2):
+            weight = min(weight, self.weight(vertex1, vertex2))
+        if weight == 1:
+            self._forget_weight(vertex1, vertex2)
+        else:
+            self._weights[vertex1][vertex2] = weight
+
+    def _forget_weight(self, vertex1, vertex2):
+        weights = self._weights.get(vertex1)
+        if weights:
+            weights.pop(vertex2, None)
+
+    def weight(self, vertex1, vertex2):
+        if not self.has_edge(vertex1, vertex2):
+            raise KeyError(f"no edge {vertex1!r} -> {vertex2!r}")
+        return self._weights.get(vertex1, {}).get(vertex2, 1)
+
+    def _link(self, vertex1, vertex2):
+        neighbors = self.graph[vertex1]
+        neighbors[vertex2] = neighbors.get(vertex2, 0) + 1
+        if self.directed:
+            self._predecessors[vertex2].add(vertex1)
+
+    def _unlink(self, vertex1, vertex2):
+        neighbors = self.graph[vertex1]
+        neighbors[vertex2] -= 1
+        if not neighbors[vertex2]:
+            del neighbors[vertex2]
+            if self.directed:
+                self._predecessors[vertex2].discard(vertex1)
 
     def remove_edge(self, vertex1, vertex2):
         if vertex1 in self.graph and vertex2 in self.graph:
-            if vertex2 in self.graph[vertex1]:
-                self.graph[vertex1].remove(vertex2)
-            if not self.directed and vertex1 in self.graph[vertex2]:
-                self.graph[vertex2].remove(vertex1)
+            if self.has_edge(vertex1, vertex2):
+                self._remove_one(vertex1, vertex2)
+            if not self.directed and self.has_edge(vertex2, vertex1):
+                self._remove_one(vertex2, vertex1)
+            self._components_stale = True
+
+    def _remove_one(self, vertex1, vertex2):
+        if self.adjacency == "dict":
+            self._unlink(vertex1, vertex2)
+        else:
+            self.graph[vertex1].remove(vertex2)
+            counts = self._list_counts()[vertex1]
+            counts[vertex2] -= 1
+            if not counts[vertex2]:
+                del counts[vertex2]
+        if not self.has_edge(vertex1, vertex2):
+            self._forget_weight(vertex1, vertex2)
+
+    def remove_vertex(self, vertex):
+        """Remove a vertex and every edge touching it: O(deg) in dict mode"""
+        if vertex not in self.graph:
+            return
+        neighbors = self.graph.pop(vertex)
+        self._weights.pop(vertex, None)
+        self._components_stale = True
+        if self.directed and self.adjacency == "dict":
+            sources = self._predecessors.pop(vertex, set())
+        elif self.directed:
+            sources = [source for source in self.graph if self.has_edge(source, vertex)]
+        else:
+            sources = neighbors
+
+        for source in set(sources) - {vertex}:
+            self._forget_weight(source, vertex)
+            if self.adjacency == "dict":
+                del self.graph[source][vertex]
+            else:
+                self.graph[source] = [neighbor for neighbor in self.graph[source] if neighbor != vertex]
+                if self._edge_count is not None:
+                    self._edge_count[source].pop(vertex, None)
+        if self.adjacency == "dict":
+            if self.directed:
+                for neighbor in set(neighbors) - {vertex}:
+                    self._predecessors[neighbor].discard(vertex)
+        elif self._edge_count is not None:
+            self._edge_count.pop(vertex, None)
+
+    def has_edge(self, vertex1, vertex2):
+        if self.adjacency == "dict":
+            return vertex2 in self.graph.get(vertex1, ())
+        return vertex2 in self._list_counts().get(vertex1, ())
+
+    def _multiplicities(self, neighbors):
+        # (neighbor, edge count) pairs for either adjacency mode
+        return neighbors.items() if self.adjacency == "dict" else ((neighbor, 1) for neighbor in neighbors)
+
+    def _expanded(self, neighbors):
+        # One entry per parallel edge, as list mode stores them, for either adjacency mode
+        if self.adjacency == "list":
+            return neighbors
+        return itertools.chain.from_iterable(itertools.repeat(neighbor, count) for neighbor, count in neighbors.items())
 
     def get_vertices(self):
         return list(self.graph.keys())
 
-    def get_edges(self):
-        edges = []
-        for vertex in self.graph:
-            for neighbor in self.graph[vertex]:
-                if not self.directed:
-                    if (neighbor, vertex) not in edges:
-                        edges.append((vertex, neighbor))
-                else:
-                    edges.append((vertex, neighbor))
-        return edges
+    def iter_edges(self):
+        """Lazily yield each edge once, in O(V + E) overall"""
+        if self.directed:
+            for vertex, neighbors in self.graph.items():
+                for neighbor, count in self._multiplicities(neighbors):
+                    for _ in range(count):
+                        yield (vertex, neighbor)
+            return
 
-    def bfs(self, start_vertex):
-        visited = set()
-        queue = deque([start_vertex])
-        visited.add(start_vertex)
-        traversal = []
+        # Each undirected edge is stored in both lists: report it from the vertex added first
+        position = {vertex: i for i, vertex in enumerate(self.graph)}
+        for vertex, neighbors in self.graph.items():
+            here = position[vertex]
+            loops = 0
+            for neighbor, count in self._multiplicities(neighbors):
+                for _ in range(count):
+                    if neighbor == vertex:
+                        # An undirected self-loop is stored twice in its own list
+                        loops += 1
+                        if loops % 2:
+                            yield (vertex, vertex)
+                    elif here < position[neighbor]:
+                        yield (vertex, neighbor)
+
+    def get_edges(self):
+        return list(self.iter_edges())
 
+    def iter_bfs(self, start_vertex, max_depth=None):
+        """Lazily yield (vertex, depth, parent) in BFS order; stop iterating to stop the search"""
+        visited = {start_vertex}
+        queue = deque([(start_vertex, 0, None)])
         while queue:
-            vertex = queue.popleft()
-            traversal.append(vertex)
-            for neighbor in self.graph[vertex]:
+            vertex, depth, parent = queue.popleft()
+            yield vertex, depth, parent
+            if max_depth is not None and depth >= max_depth:
+                continue
+            for neighbor in self.graph.get(vertex, ()):
                 if neighbor not in visited:
                     visited.add(neighbor)
-                    queue.append(neighbor)
-        return traversal
+                    queue.append((neighbor, depth + 1, vertex))
 
-    def dfs(self, start_vertex, visited=None, traversal=None):
+    def iter_dfs(self, start_vertex, max_depth=None, visited=None):
+        """Lazily yield (vertex, depth, parent) in DFS preorder, using an explicit stack of neighbor iterators"""
         if visited is None:
             visited = set()
-        if traversal is None:
-            traversal = []
-            
         visited.add(start_vertex)
-        traversal.append(start_vertex)
+        yield start_vertex, 0, None
+        if max_depth is not None and max_depth <= 0:
+            return
+        stack = [(start_vertex, 0, iter(self.graph.get(start_vertex, ())))]
+        while stack:
+            vertex, depth, neighbors = stack[-1]
+            for neighbor in neighbors:
+                if neighbor not in visited:
+                    visited.add(neighbor)
+                    yield neighbor, depth + 1, vertex
+                    if max_depth is None or depth + 1 < max_depth:
+                        stack.append((neighbor, depth + 1, iter(self.graph.get(neighbor, ()))))
+                    break
+            else:
+                stack.pop()
+
+    def bfs(self, start_vertex):
+        return [vertex for vertex, _, _ in self.iter_bfs(start_vertex)]
 
-        for neighbor in self.graph[start_vertex]:
-            if neighbor not in visited:
-                self.dfs(neighbor, visited, traversal)
+    def dfs(self, start_vertex, visited=None, traversal=None):
+        if traversal is None:
+            traversal = []
+        traversal.extend(vertex for vertex, _, _ in self.iter_dfs(start_vertex, visited=visited))
         return traversal
 
+    def dijkstra(self, source, target=None):
+        """Shortest weighted distances from source: binary heap with lazy deletion of stale entries.
+
+        Returns (distances, parents); with a target, stops as soon as the target is settled.
+        """
+        distances, parents = {source: 0}, {source: None}
+        tie_breaker = itertools.count()  # vertices need not be comparable
+        heap = [(0, next(tie_breaker), source)]
+        while heap:
+            distance, _, vertex = heapq.heappop(heap)
+            if distance > distances[vertex]:
+                continue
+            if vertex == target:
+                break
+            weights = self._weights.get(vertex, {})
+            for neighbor in self.graph.get(vertex, ()):
+                weight = weights.get(neighbor, 1)
+                if weight < 0:
+                    raise ValueError("dijkstra() requires non-negative edge weights")
+                candidate = distance + weight
+                if candidate < distances.get(neighbor, math.inf):
+                    distances[neighbor] = candidate
+                    parents[neighbor] = vertex
+                    heapq.heappush(heap, (candidate, next(tie_breaker), neighbor))
+        return distances, parents
+
+    @staticmethod
+    def _reconstruct_path(parents, target):
+        path = []
+        while target is not None:
+            path.append(target)
+            target = parents[target]
+        return path[::-1]
+
+    def weighted_path(self, source, target):
+        """(distance, path) of a cheapest source -> target path, or (inf, []) if unreachable"""
+        distances, parents = self.dijkstra(source, target)
+        if target not in distances:
+            return math.inf, []
+        return distances[target], self._reconstruct_path(parents, target)
+
+    def a_star(self, source, target, heuristic=None):
+        """(distance, path) using A*; heuristic(vertex, target) must never overestimate the remaining cost"""
+        if heuristic is None:
+            heuristic = lambda vertex, goal: 0
+        costs, parents = {source: 0}, {source: None}
+        tie_breaker = itertools.count()
+        heap = [(heuristic(source, target), next(tie_breaker), 0, source)]
+        while heap:
+            _, _, cost, vertex = heapq.heappop(heap)
+            if cost > costs[vertex]:
+                continue
+            if vertex == target:
+                return cost, self._reconstruct_path(parents, target)
+            weights = self._weights.get(vertex, {})
+            for neighbor in self.graph.get(vertex, ()):
+                weight = weights.get(neighbor, 1)
+                if weight < 0:
+                    raise ValueError("a_star() requires non-negative edge weights")
+                candidate = cost + weight
+                if candidate < costs.get(neighbor, math.inf):
+                    costs[neighbor] = candidate
+                    parents[neighbor] = vertex
+                    heapq.heappush(heap, (candidate + heuristic(neighbor, target), next(tie_breaker), candidate, neighbor))
+        return math.inf, []
+
+    def _expand_level(self, frontier, adjacency, parents, other_parents):
+        # Expand one whole BFS level and keep the meeting vertex with the shortest total path
+        next_frontier, meeting, best = [], None, math.inf
+        for vertex in frontier:
+            depth = parents[vertex][1]
+            for neighbor in adjacency.get(vertex, ()):
+                if neighbor in parents:
+                    continue
+                parents[neighbor] = (vertex, depth + 1)
+                next_frontier.append(neighbor)
+                if neighbor in other_parents and depth + 1 + other_parents[neighbor][1] < best:
+                    meeting, best = neighbor, depth + 1 + other_parents[neighbor][1]
+        return next_frontier, meeting
+
+    def _bidirectional_search(self, source, target):
+        """(path, vertices visited); the backward side follows edges in reverse"""
+        if source not in self.graph or target not in self.graph:
+            return [], 0
+        if source == target:
+            return [source], 1
+        if self.directed and self.adjacency != "dict":
+            # List mode keeps no reverse index, so search forwards only and stop at the target
+            parents = {}
+            for vertex, _, parent in self.iter_bfs(source):
+                parents[vertex] = parent
+                if vertex == target:
+                    return self._reconstruct_path(parents, target), len(parents)
+            return [], len(parents)
+
+        backward_adjacency = self._predecessors if self.directed else self.graph
+        forward, backward = {source: (None, 0)}, {target: (None, 0)}
+        forward_frontier, backward_frontier = [source], [target]
+        while forward_frontier and backward_frontier:
+            if len(forward_frontier) <= len(backward_frontier):
+                forward_frontier, meeting = self._expand_level(forward_frontier, self.graph, forward, backward)
+            else:
+                backward_frontier, meeting = self._expand_level(backward_frontier, backward_adjacency, backward, forward)
+            if meeting is not None:
+                path, vertex = [], meeting
+                while vertex is not None:
+                    path.append(vertex)
+                    vertex = forward[vertex][0]
+                path.reverse()
+                vertex = backward[meeting][0]
+                while vertex is not None:
+                    path.append(vertex)
+                    vertex = backward[vertex][0]
+                return path, len(forward) + len(backward)
+        return [], len(forward) + len(backward)
+
+    def shortest_path(self, source, target):
+        """Fewest-hop path via bidirectional BFS, always expanding the smaller frontier; [] if unreachable"""
+        return self._bidirectional_search(source, target)[0]
+
+    def degrees_of_separation(self, source, target):
+        """Number of hops between two vertices, or None if they are not connected"""
+        path = self.shortest_path(source, target)
+        return len(path) - 1 if path else None
+
+    def _neighbor_counts(self, vertex):
+        # {neighbor: multiplicity} in either adjacency mode, so distinct neighbors need no set()
+        if self.adjacency == "dict":
+            return self.graph.get(vertex, {})
+        return self._list_counts().get(vertex, {})
+
+    def recommend_friends(self, vertex, k=10, metric="common"):
+        """Top-k non-neighbors of vertex as (vertex, score), by 'common' neighbors, 'jaccard' or 'adamic_adar'"""
+        if metric not in ("common", "jaccard", "adamic_adar"):
+            raise ValueError("metric must be 'common', 'jaccard' or 'adamic_adar'")
+        if metric == "jaccard" and self.directed:
+            raise ValueError("jaccard compares neighbor sets, so it needs an undirected graph")
+        friends = self._neighbor_counts(vertex)
+        scores = defaultdict(float)
+        for middle in friends:
+            if middle == vertex:
+                continue
+            middle_friends = self._neighbor_counts(middle)
+            weight = 1
+            if metric == "adamic_adar":
+                degree = len(middle_friends) - (middle in middle_friends)
+                if degree < 2:
+                    continue
+                weight = 1 / math.log(degree)
+            for candidate in middle_friends:
+                if candidate != vertex and candidate != middle and candidate not in friends:
+                    scores[candidate] += weight
+        if metric == "jaccard":
+            friend_count = len(friends) - (vertex in friends)
+            for candidate, common in scores.items():
+                candidate_friends = self._neighbor_counts(candidate)
+                # |N(u) ∪ N(c)| = |N(u)| + |N(c)| - |N(u) ∩ N(c)|, never 0 since common >= 1
+                union = friend_count + len(candidate_friends) - (candidate in candidate_friends) - common
+                scores[candidate] = common / union
+        # nlargest keeps a heap of only k entries
+        return heapq.nlargest(k, scores.items(), key=lambda item: item[1])
+
+    def _current_components(self):
+        if self._components_stale:
+            self._components = DisjointSet()
+            for vertex in self.graph:
+                self._components.add(vertex)
+            for vertex, neighbors in self.graph.items():
+                for neighbor in neighbors:
+                    self._components.union(vertex, neighbor)
+            self._components_stale = False
+        return self._components
+
+    def connected(self, vertex1, vertex2):
+        """Whether a path joins the two vertices, ignoring edge direction"""
+        components = self._current_components()
+        if vertex1 not in components.parent or vertex2 not in components.parent:
+            return False
+        return components.find(vertex1) == components.find(vertex2)
+
+    def component_size(self, vertex):
+        components = self._current_components()
+        if vertex not in components.parent:
+            raise KeyError(f"no vertex {vertex!r}")
+        return components.size[components.find(vertex)]
+
+    def component_count(self):
+        return self._current_components().count
+
+    def degree_centrality(self):
+        """Fraction of the other vertices each vertex is linked to (out-links when directed).
+
+        Parallel edges count once and self-loops not at all, so scores stay within [0, 1].
+        """
+        others = max(len(self.graph) - 1, 1)
+        scores = {}
+        for vertex in self.graph:
+            neighbors = self._neighbor_counts(vertex)
+            scores[vertex] = (len(neighbors) - (vertex in neighbors)) / others
+        return scores
+
+    def pagerank(self, damping=0.85, tol=1e-6, max_iter=100):
+        """PageRank score per vertex, computed on a frozen CSR copy (see CSRGraph.pagerank)"""
+        frozen = self.freeze()
+        return dict(zip(frozen.vertices, frozen.pagerank(damping, tol, max_iter).tolist()))
+
+    def betweenness(self, samples=None, seed=None):
+        """Betweenness centrality per vertex, exact or estimated from sampled sources (see CSRGraph.betweenness)"""
+        frozen = self.freeze()
+        return dict(zip(frozen.vertices, frozen.betweenness(samples, seed).tolist()))
+
+    def freeze(self):
+        """Immutable NumPy CSR copy of the adjacency lists for vectorized traversal"""
+        if np is None:
+            raise ImportError("freeze() requires NumPy")
+        vertices = list(self.graph)
+        index = {vertex: i for i, vertex in enumerate(vertices)}
+        if self.adjacency == "list":
+            degrees = [len(self.graph[vertex]) for vertex in vertices]
+        else:
+            degrees = [sum(self.graph[vertex].values()) for vertex in vertices]
+        total = sum(degrees)
+        offsets = np.zeros(len(vertices) + 1, dtype=np.int32 if total < 2**31 else np.int64)
+        np.cumsum(degrees, out=offsets[1:])
+        neighbors = np.fromiter(
+            (index[neighbor] for vertex in vertices for neighbor in self._expanded(self.graph[vertex])),
+            dtype=np.int32 if len(vertices) < 2**31 else np.int64, count=total,
+        )
+        weights = None
+        if any(self._weights.values()):
+            weights = np.fromiter(
+                (self._weights.get(vertex, {}).get(neighbor, 1) for vertex in vertices for neighbor in self._expanded(self.graph[vertex])),
+                dtype=np.float64, count=total,
+            )
+        return CSRGraph(vertices, offsets, neighbors, self.directed, weights)
+
+    @staticmethod
+    def from_edge_list(path, directed=False, delimiter=None, adjacency="list", chunk_bytes=1 << 20):
+        """Build a Graph from a 'source target [weight]' file in bulk, without an add_edge call per line"""
+        return CSRGraph.from_edge_list(path, directed, delimiter, chunk_bytes).thaw(adjacency)
+
     def print_graph(self):
         if not self.graph:
             return "Empty graph"
@@ -107,6 +585,836 @@ class Graph:
             result.append(f"{vertex}: {neighbors}")
         return "\n".join(result)
 
+def _gather(offsets, neighbors, ids):
+    """Concatenated CSR rows for ids: neighbors[offsets[i]:offsets[i + 1]] for each i, in one vectorized step"""
+    starts = offsets[ids]
+    counts = offsets[ids + 1] - starts
+    total = int(counts.sum())
+    if not total:
+        return neighbors[:0]
+    # Position k of the output reads neighbors[starts[j] + (k - output start of j)]
+    shift = np.repeat(starts - (np.cumsum(counts) - counts), counts)
+    return neighbors[shift + np.arange(total, dtype=shift.dtype)]
+
+class CSRGraph:
+    """Immutable compressed-sparse-row adjacency built by Graph.freeze(), from_edge_list() or load()
+
+    Vertex i's neighbors are neighbors[offsets[i]:offsets[i + 1]], as integer ids, and
+    weights (None when every edge weighs 1) runs parallel to neighbors;
+    `vertices` maps ids back to the original vertex names and `index` maps names to ids.
+    """
+
+    FILE_MAGIC = b"CSR1"
+    # magic, directed, offset dtype, neighbor dtype (explicit little-endian codes such as b"<i4"),
+    # vertex name type, weighted, vertex count, neighbor entry count, vertex name blob length;
+    # every column is stored little-endian so snapshots move between platforms
+    FILE_HEADER = struct.Struct("<4s?3s3sc?3xQQQ")
+
+    def __init__(self, vertices, offsets, neighbors, directed, weights=None):
+        self.vertices = vertices
+        self._index = None
+        self.offsets = offsets
+        self.neighbors = neighbors
+        self.weights = weights
+        self.directed = directed
+        for array in (offsets, neighbors, weights):
+            if array is not None:
+                array.flags.writeable = False
+
+    @property
+    def index(self):
+        # Built on first use, so a mapped snapshot opens without touching every vertex name
+        if self._index is None:
+            self._index = {vertex: i for i, vertex in enumerate(self.vertices)}
+        return self._index
+
+    def __len__(self):
+        return len(self.vertices)
+
+    def num_edges(self):
+        edges = len(self.neighbors)
+        return edges if self.directed else edges // 2
+
+    def degree(self, vertex=None):
+        """Degree of one vertex, or an array of every vertex's degree when vertex is None"""
+        if vertex is None:
+            return np.diff(self.offsets)
+        i = self.index[vertex]
+        return int(self.offsets[i + 1] - self.offsets[i])
+
+    def neighbor_ids(self, vertex_id):
+        return self.neighbors[self.offsets[vertex_id]:self.offsets[vertex_id + 1]]
+
+    def get_neighbors(self, vertex):
+        return [self.vertices[j] for j in self.neighbor_ids(self.index[vertex]).tolist()]
+
+    def expand(self, frontier):
+        """All neighbor ids of the ids in frontier (with repeats), gathered without a Python loop"""
+        return _gather(self.offsets, self.neighbors, frontier)
+
+    def bfs_distances(self, start_vertex):
+        """Hop count from start_vertex to every vertex id (-1 if unreachable), one vectorized step per level"""
+        distances = np.full(len(self.vertices), -1, dtype=np.int64)
+        frontier = np.array([self.index[start_vertex]], dtype=self.neighbors.dtype)
+        distances[frontier] = 0
+        level = 0
+        while frontier.size:
+            found = self.expand(frontier)
+            frontier = np.unique(found[distances[found] < 0])
+            level += 1
+            distances[frontier] = level
+        return distances
+
+    def bfs(self, start_vertex):
+        """Vertices in BFS level order (ties within a level are ordered by vertex id)"""
+        return self._level_order(self.bfs_distances(start_vertex))
+
+    def parallel_bfs(self, start_vertex, processes=None):
+        """Same result as bfs, with large frontiers expanded by a process pool (see ParallelBFS)"""
+        with ParallelBFS(self, processes) as search:
+            return self._level_order(search.distances(start_vertex))
+
+    def _level_order(self, distances):
+        reached = np.flatnonzero(distances >= 0)
+        order = reached[np.argsort(distances[reached], kind="stable")]
+        return [self.vertices[i] for i in order.tolist()]
+
+    def _simple_adjacency(self):
+        # Drop parallel edges and self-loops so every neighbor counts once
+        n = len(self.vertices)
+        rows = np.repeat(np.arange(n, dtype=np.int64), np.diff(self.offsets))
+        keys = np.unique(rows * n + self.neighbors)
+        rows, columns = keys // n, keys % n
+        keep = rows != columns
+        rows, columns = rows[keep], columns[keep]
+        offsets = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=n), out=offsets[1:])
+        return offsets, columns
+
+    def recommend_all(self, k=10, metric="common", chunk_size=1024):
+        """Top-k non-neighbor recommendations for every vertex at once.
+
+        Scores come from the sparse product A·A (paths of length two), computed for
+        chunk_size rows at a time. Returns (ids, scores) arrays of shape (n, k);
+        unused slots hold id -1 and score 0.
+        """
+        if metric not in ("common", "jaccard", "adamic_adar"):
+            raise ValueError("metric must be 'common', 'jaccard' or 'adamic_adar'")
+        if metric == "jaccard" and self.directed:
+            raise ValueError("jaccard compares neighbor sets, so it needs an undirected graph")
+        offsets, neighbors = self._simple_adjacency()
+        n = len(self.vertices)
+        degrees = np.diff(offsets)
+        middle_weight = None
+        if metric == "adamic_adar":
+            middle_weight = np.zeros(n)
+            hubs = degrees > 1
+            middle_weight[hubs] = 1 / np.log(degrees[hubs])
+
+        top_ids = np.full((n, k), -1, dtype=np.int64)
+        top_scores = np.zeros((n, k))
+        for start in range(0, n, chunk_size):
+            users = np.arange(start, min(start + chunk_size, n))
+            # Two hops: user -> middle -> candidate, remembering which user each row came from
+            middles = _gather(offsets, neighbors, users)
+            middle_owner = np.repeat(users, degrees[users])
+            candidates = _gather(offsets, neighbors, middles)
+            owner = np.repeat(middle_owner, degrees[middles])
+            weights = np.repeat(middle_weight[middles], degrees[middles]) if middle_weight is not None else None
+
+            keys, inverse = np.unique(owner * n + candidates, return_inverse=True)
+            scores = np.bincount(inverse.ravel(), weights=weights).astype(float)
+            rows, columns = keys // n, keys % n
+            # Adamic-Adar gives middles of degree 1 no weight, so their candidates score 0: drop them
+            keep = (rows != columns) & ~np.isin(keys, middle_owner * n + middles) & (scores > 0)
+            rows, columns, scores = rows[keep], columns[keep], scores[keep]
+            if metric == "jaccard":
+                scores = scores / (degrees[rows] + degrees[columns] - scores)
+
+            # Per-row top-k: sort by row, then score descending, and keep the first k of each row
+            order = np.lexsort((-scores, rows))
+            rows, columns, scores = rows[order], columns[order], scores[order]
+            rank = np.arange(len(rows)) - np.searchsorted(rows, rows)
+            chosen = rank < k
+            top_ids[rows[chosen], rank[chosen]] = columns[chosen]
+            top_scores[rows[chosen], rank[chosen]] = scores[chosen]
+        return top_ids, top_scores
+
+    def pagerank(self, damping=0.85, tol=1e-6, max_iter=100):
+        """PageRank by power iteration: one sparse matrix-vector product (gather + bincount) per step.
+
+        Parallel edges count as separate links. Rank held by dangling vertices (no out-edges)
+        is spread evenly over all vertices. Stops once the L1 change drops below tol.
+        Returns an array of scores indexed by vertex id, summing to 1.
+        """
+        n = len(self.vertices)
+        if not n:
+            return np.zeros(0)
+        out_degree = np.diff(self.offsets)
+        sources = np.repeat(np.arange(n), out_degree)
+        dangling = out_degree == 0
+        share = np.zeros(n)
+        share[~dangling] = 1 / out_degree[~dangling]
+        rank = np.full(n, 1 / n)
+        for _ in range(max_iter):
+            spread = np.bincount(self.neighbors, weights=(rank * share)[sources], minlength=n)
+            new_rank = damping * spread + (damping * rank[dangling].sum() + 1 - damping) / n
+            change = np.abs(new_rank - rank).sum()
+            rank = new_rank
+            if change < tol:
+                break
+        return rank
+
+    def degree_centrality(self):
+        """Distinct other neighbors / (n - 1) per vertex id: out-neighbors for directed graphs.
+
+        Parallel edges count once and self-loops not at all, matching Graph.degree_centrality.
+        """
+        offsets, _ = self._simple_adjacency()
+        return np.diff(offsets) / max(len(self.vertices) - 1, 1)
+
+    def betweenness(self, samples=None, seed=None):
+        """Betweenness centrality per vertex id by Brandes' algorithm, level-synchronous and vectorized.
+
+        With samples, only that many random sources are used and the result is scaled by
+        n / samples: an unbiased estimate at a fraction of the O(V * E) exact cost.
+        Parallel edges and self-loops are ignored.
+        """
+        offsets, neighbors = self._simple_adjacency()
+        n = len(self.vertices)
+        degrees = np.diff(offsets)
+        if samples is None or samples >= n:
+            sources = np.arange(n)
+        else:
+            sources = np.random.default_rng(seed).choice(n, samples, replace=False)
+
+        centrality = np.zeros(n)
+        for source in sources.tolist():
+            distances = np.full(n, -1)
+            paths = np.zeros(n)  # sigma: number of shortest paths from the source
+            distances[source] = 0
+            paths[source] = 1
+            frontier = np.array([source])
+            levels = []
+            while frontier.size:
+                parents = np.repeat(frontier, degrees[frontier])
+                children = _gather(offsets, neighbors, frontier)
+                fresh = distances[children] < 0
+                distances[children[fresh]] = len(levels) + 1
+                # Keep the edges that lie on shortest paths: child one level deeper than parent
+                on_path = distances[children] == len(levels) + 1
+                parents, children = parents[on_path], children[on_path]
+                paths += np.bincount(children, weights=paths[parents], minlength=n)
+                levels.append((parents, children))
+                frontier = np.unique(children)
+
+            dependency = np.zeros(n)
+            for parents, children in reversed(levels):
+                dependency += np.bincount(
+                    parents, weights=paths[parents] / paths[children] * (1 + dependency[children]), minlength=n,
+                )
+            dependency[source] = 0
+            centrality += dependency
+
+        centrality *= n / len(sources) if len(sources) else 0
+        if not self.directed:
+            centrality /= 2
+        return centrality
+
+    @staticmethod
+    def from_edge_list(path, directed=False, delimiter=None, chunk_bytes=1 << 20):
+        """Stream a 'source target [weight]' edge list (whitespace or delimiter separated) into a CSRGraph.
+
+        The file is parsed chunk_bytes at a time; vertex names are interned to integer ids as
+        they are first seen, and each chunk is kept only as id and weight arrays until the
+        adjacency is built in one sort. Blank lines and lines starting with '#' are skipped.
+        Vertex names stay strings.
+        """
+        if np is None:
+            raise ImportError("from_edge_list() requires NumPy")
+        index = {}
+        source_chunks, target_chunks, weight_chunks = [], [], []
+        weighted = False
+        for endpoints, weights in _edge_chunks(path, delimiter, chunk_bytes):
+            ids = np.fromiter((index.setdefault(name, len(index)) for name in endpoints), np.int64, len(endpoints))
+            source_chunks.append(ids[0::2])
+            target_chunks.append(ids[1::2])
+            weight_chunks.append(weights)
+            weighted = weighted or bool((weights != 1).any())
+
+        sources = np.concatenate(source_chunks) if source_chunks else np.zeros(0, dtype=np.int64)
+        targets = np.concatenate(target_chunks) if target_chunks else np.zeros(0, dtype=np.int64)
+        weights = np.concatenate(weight_chunks) if weighted else None
+        offsets, neighbors, weights = _csr_arrays(len(index), sources, targets, weights, directed)
+        return CSRGraph(list(index), offsets, neighbors, directed, weights)
+
+    def thaw(self, adjacency="list"):
+        """Mutable Graph with the same vertices and edges, filled in bulk rather than edge by edge"""
+        graph = Graph(adjacency=adjacency)
+        n = len(self.vertices)
+        names = list(self.vertices)
+        named = list(map(names.__getitem__, self.neighbors.tolist()))
+        bounds = self.offsets.tolist()
+        for i, vertex in enumerate(names):
+            row = named[bounds[i]:bounds[i + 1]]
+            graph.graph[vertex] = row if adjacency == "list" else dict(Counter(row))
+        if self.weights is not None:
+            # Parallel edges share their smallest weight, as add_edge keeps it
+            sources = np.repeat(np.arange(n, dtype=np.int64), np.diff(self.offsets))
+            keys, inverse = np.unique(sources * n + self.neighbors, return_inverse=True)
+            smallest = np.full(len(keys), np.inf)
+            np.minimum.at(smallest, inverse.ravel(), self.weights)
+            for key, weight in zip(keys[smallest != 1].tolist(), smallest[smallest != 1].tolist()):
+                graph._weights[names[key // n]][names[key % n]] = weight
+        graph._components_stale = True
+        graph.directed = self.directed
+        return graph
+
+    def save(self, path):
+        """Write a binary snapshot: header, then offsets, neighbors, weights and vertex name columns"""
+        names = list(self.vertices)
+        if all(type(name) is int for name in names):
+            name_code, name_columns, blob_length = b"q", [np.array(names, dtype="<i8")], 0
+        elif all(type(name) is str for name in names):
+            encoded = [name.encode() for name in names]
+            name_offsets = np.zeros(len(names) + 1, dtype="<u8")
+            np.cumsum([len(chunk) for chunk in encoded], out=name_offsets[1:])
+            blob = b"".join(encoded)
+            name_code, name_columns, blob_length = b"s", [name_offsets, blob], len(blob)
+        else:
+            raise TypeError("save() supports graphs whose vertex names are all int or all str")
+
+        columns = [_little_endian(self.offsets), _little_endian(self.neighbors)]
+        if self.weights is not None:
+            columns.append(_little_endian(self.weights))
+        with open(path, "wb") as f:
+            f.write(self.FILE_HEADER.pack(
+                self.FILE_MAGIC, self.directed, columns[0].dtype.str.encode(), columns[1].dtype.str.encode(),
+                name_code, self.weights is not None, len(names), len(self.neighbors), blob_length,
+            ))
+            for column in columns + name_columns:
+                data = column if isinstance(column, bytes) else column.tobytes()
+                f.write(data)
+                f.write(b"\0" * (-len(data) % 8))
+
+    @staticmethod
+    def load(path):
+        """Open a save() snapshot through a read-only mmap: the arrays are views of the file, nothing is parsed"""
+        if np is None:
+            raise ImportError("load() requires NumPy")
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        header = CSRGraph.FILE_HEADER.unpack_from(mapped, 0)
+        magic, directed, offset_code, index_code, name_code, weighted, count, entries, blob_length = header
+        if magic != CSRGraph.FILE_MAGIC:
+            mapped.close()
+            raise ValueError(f"{path} is not a CSRGraph snapshot")
+
+        position = CSRGraph.FILE_HEADER.size
+
+        def column(dtype, length):
+            nonlocal position
+            array = np.frombuffer(mapped, dtype=dtype, count=length, offset=position)
+            position += array.nbytes + (-array.nbytes % 8)
+            return array
+
+        offsets = column(offset_code.decode(), count + 1)
+        neighbors = column(index_code.decode(), entries)
+        weights = column("<f8", entries) if weighted else None
+        if name_code == b"s":
+            vertices = _VertexNames(column("<u8", count + 1), column(np.uint8, blob_length))
+        else:
+            vertices = _VertexNames(column("<i8", count))
+        return CSRGraph(vertices, offsets, neighbors, directed, weights)
+
+    def nbytes(self):
+        weights = self.weights.nbytes if self.weights is not None else 0
+        return self.offsets.nbytes + self.neighbors.nbytes + weights
+
+def _little_endian(array):
+    return np.ascontiguousarray(array, dtype=array.dtype.newbyteorder("<"))
+
+class _VertexNames(Sequence):
+    """Vertex names of a mapped snapshot, decoded one at a time as they are looked up"""
+
+    def __init__(self, offsets_or_ints, blob=None):
+        self._offsets = offsets_or_ints
+        self._blob = blob
+
+    def __len__(self):
+        return len(self._offsets) - (1 if self._blob is not None else 0)
+
+    def __getitem__(self, i):
+        if self._blob is None:
+            return int(self._offsets[i])
+        if not -len(self) <= i < len(self):
+            raise IndexError("vertex id out of range")
+        i %= len(self)
+        return self._blob[self._offsets[i]:self._offsets[i + 1]].tobytes().decode()
+
+def _edge_chunks(path, delimiter, chunk_bytes):
+    # Yield ([source, target, source, target, ...], weights) for each chunk of about chunk_bytes of the file;
+    # names are interned in that order, so vertex ids follow first appearance as with add_edge
+    with open(path, encoding="utf-8") as f:
+        line_number = 0
+        while True:
+            lines = f.readlines(chunk_bytes)
+            if not lines:
+                return
+            endpoints, weights = [], []
+            for line in lines:
+                line_number += 1
+                line = line.strip()
+                if not line or line.startswith("#"):
+                    continue
+                fields = line.split(delimiter)
+                if delimiter is not None:
+                    fields = [field.strip() for field in fields]
+                if len(fields) == 2:
+                    weight = 1
+                elif len(fields) == 3:
+                    try:
+                        weight = float(fields[2])
+                    except ValueError:
+                        raise ValueError(f"{path}:{line_number}: weight {fields[2]!r} is not a number") from None
+                else:
+                    raise ValueError(f"{path}:{line_number}: expected 'source target [weight]'")
+                endpoints.append(fields[0])
+                endpoints.append(fields[1])
+                weights.append(weight)
+            yield endpoints, np.array(weights, dtype=np.float64)
+
+def _csr_arrays(num_vertices, sources, targets, weights, directed):
+    # Bulk CSR build from parallel id arrays; rows keep the input order, as repeated add_edge calls would
+    if not directed:
+        # Interleave each edge with its reverse, so both rows see edges in input order
+        sources, targets = np.column_stack((sources, targets)).ravel(), np.column_stack((targets, sources)).ravel()
+        if weights is not None:
+            weights = np.repeat(weights, 2)
+    order = np.argsort(sources, kind="stable")
+    offsets = np.zeros(num_vertices + 1, dtype=np.int32 if len(order) < 2**31 else np.int64)
+    np.cumsum(np.bincount(sources, minlength=num_vertices), out=offsets[1:])
+    neighbors = targets[order].astype(np.int32 if num_vertices < 2**31 else np.int64)
+    return offsets, neighbors, weights[order] if weights is not None else None
+
+# Worker-side views of the shared arrays, attached once per process by the pool initializer
+_shared_arrays = {}
+
+def _attach_shared(specs):
+    for name, (block_name, shape, dtype) in specs.items():
+        block = shared_memory.SharedMemory(name=block_name)
+        _shared_arrays[name] = (block, np.ndarray(shape, dtype=dtype, buffer=block.buf))
+
+def _expand_chunk(frontier):
+    offsets, neighbors, distances = (_shared_arrays[name][1] for name in ("offsets", "neighbors", "distances"))
+    found = _gather(offsets, neighbors, frontier)
+    return np.unique(found[distances[found] < 0])
+
+class ParallelBFS:
+    """Level-synchronous BFS over a CSRGraph, splitting each large frontier across a process pool.
+
+    offsets, neighbors and the distance array live in shared memory, so workers read them without
+    copying; each worker returns the unvisited vertices its slice of the frontier discovered and
+    the parent merges them into the next level. Frontiers smaller than two chunks of min_chunk
+    vertices are expanded in the parent, where shipping them would cost more than it saves.
+    Use as a context manager, or call close() to stop the pool and free the shared memory.
+    """
+
+    def __init__(self, csr, processes=None, min_chunk=1 << 14):
+        self.csr = csr
+        self.processes = processes or os.cpu_count() or 1
+        self.min_chunk = min_chunk
+        self._blocks = []
+        self._arrays = {}
+        specs = {}
+        distances = np.empty(len(csr), dtype=np.int64)
+        for name, array in (("offsets", csr.offsets), ("neighbors", csr.neighbors), ("distances", distances)):
+            block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+            view = np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)
+            view[...] = array
+            self._blocks.append(block)
+            self._arrays[name] = view
+            specs[name] = (block.name, array.shape, array.dtype.str)
+        self._pool = None
+        if self.processes > 1:
+            self._pool = multiprocessing.Pool(self.processes, initializer=_attach_shared, initargs=(specs,))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def distances(self, start_vertex):
+        """Hop count from start_vertex to every vertex id (-1 if unreachable)"""
+        offsets, neighbors, distances = (self._arrays[name] for name in ("offsets", "neighbors", "distances"))
+        distances.fill(-1)
+        frontier = np.array([self.csr.index[start_vertex]])
+        distances[frontier] = 0
+        level = 0
+        while frontier.size:
+            parts = min(self.processes, frontier.size // self.min_chunk)
+            if parts < 2 or self._pool is None:
+                found = _gather(offsets, neighbors, frontier)
+                frontier = np.unique(found[distances[found] < 0])
+            else:
+                # A vertex found by several workers appears in several results: unique merges them
+                found = self._pool.map(_expand_chunk, np.array_split(frontier, parts))
+                frontier = np.unique(np.concatenate(found))
+            level += 1
+            distances[frontier] = level
+        return distances.copy()
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+        # The numpy views must go before the blocks they point into can be closed
+        self._arrays.clear()
+        for block in self._blocks:
+            block.close()
+            block.unlink()
+        self._blocks = []
+
+def _random_graph(num_vertices, num_edges, directed=False):
+    import random
+    graph = Graph(directed=directed)
+    for vertex in range(num_vertices):
+        graph.add_vertex(vertex)
+    for _ in range(num_edges):
+        graph.add_edge(random.randrange(num_vertices), random.randrange(num_vertices))
+    return graph
+
+def benchmark_csr(sizes=((10**4, 5 * 10**4), (10**5, 5 * 10**5), (10**6, 5 * 10**6))):
+    """Memory and BFS/degree time: dict-of-lists Graph vs frozen CSRGraph"""
+    import tracemalloc
+
+    if np is None:
+        print("\nThis benchmark needs NumPy.")
+        return
+    print(f"\n{'Vertices':>10} {'Edges':>10} {'dict MB':>9} {'CSR MB':>8} {'bfs':>9} {'CSR bfs':>9} {'degrees':>9} {'CSR deg':>9}")
+    for num_vertices, num_edges in sizes:
+        tracemalloc.start()
+        graph = _random_graph(num_vertices, num_edges)
+        dict_memory = tracemalloc.get_traced_memory()[0] / 2**20
+        tracemalloc.stop()
+        frozen = graph.freeze()
+
+        timings = []
+        for action in (lambda: graph.bfs(0), lambda: frozen.bfs_distances(0),
+                       lambda: [len(graph.graph[vertex]) for vertex in graph.graph], frozen.degree):
+            start_time = time.perf_counter()
+            action()
+            timings.append((time.perf_counter() - start_time) * 1e3)
+        print(f"{num_vertices:>10} {num_edges:>10} {dict_memory:>9.1f} {frozen.nbytes() / 2**20:>8.1f} "
+              + " ".join(f"{timing:>7.1f}ms" for timing in timings))
+    print("\ndict MB is what tracemalloc saw while building the Graph; CSR MB counts the offsets and neighbors arrays.")
+
+def benchmark_get_edges(sizes=(10**3, 10**4, 10**5), quadratic_limit=10**4):
+    """Listing edges: the old membership scan over a list vs iter_edges"""
+    def scan_edges(graph):
+        edges = []
+        for vertex in graph.graph:
+            for neighbor in graph.graph[vertex]:
+                if (neighbor, vertex) not in edges:
+                    edges.append((vertex, neighbor))
+        return edges
+
+    print(f"\n{'Edges':>10} {'list scan':>12} {'get_edges':>12}")
+    for num_edges in sizes:
+        graph = _random_graph(num_edges // 2, num_edges)
+        scan_time = "skipped"
+        if num_edges <= quadratic_limit:
+            start_time = time.perf_counter()
+            scan_edges(graph)
+            scan_time = f"{(time.perf_counter() - start_time) * 1e3:.1f}ms"
+        start_time = time.perf_counter()
+        graph.get_edges()
+        print(f"{num_edges:>10} {scan_time:>12} {(time.perf_counter() - start_time) * 1e3:>10.1f}ms")
+
+def benchmark_adjacency_modes(num_vertices=10**4, num_edges=2 * 10**5, hub_degree=10**4):
+    """List vs dict adjacency: add/remove edges and remove a hub vertex"""
+    import random
+
+    edges = [(random.randrange(num_vertices), random.randrange(num_vertices)) for _ in range(num_edges)]
+    hub_edges = [("hub", random.randrange(num_vertices)) for _ in range(hub_degree)]
+    hub_edges += [(random.randrange(num_vertices), "hub") for _ in range(hub_degree)]
+    removals = random.sample(edges, num_edges // 2)
+
+    print(f"\n{'Adjacency':>10} {'add edge':>10} {'remove edge':>12} {'remove hub':>11}   (directed, {num_edges} edges)")
+    for adjacency in ("list", "dict"):
+        graph = Graph(directed=True, adjacency=adjacency)
+        start_time = time.perf_counter()
+        for vertex1, vertex2 in edges:
+            graph.add_edge(vertex1, vertex2)
+        add_time = (time.perf_counter() - start_time) / num_edges * 1e6
+        for vertex1, vertex2 in hub_edges:
+            graph.add_edge(vertex1, vertex2)
+
+        start_time = time.perf_counter()
+        for vertex1, vertex2 in removals:
+            graph.remove_edge(vertex1, vertex2)
+        remove_time = (time.perf_counter() - start_time) / len(removals) * 1e6
+        start_time = time.perf_counter()
+        graph.remove_vertex("hub")
+        hub_time = (time.perf_counter() - start_time) * 1e3
+        print(f"{adjacency:>10} {add_time:>8.2f}µs {remove_time:>10.2f}µs {hub_time:>9.2f}ms")
+
+def _road_grid(width):
+    """width x width grid of integer intersections with random road lengths in [1, 10)"""
+    import random
+    graph = Graph(adjacency="dict")
+    for x in range(width):
+        for y in range(width):
+            vertex = x * width + y
+            if x + 1 < width:
+                graph.add_edge(vertex, vertex + width, 1 + 9 * random.random())
+            if y + 1 < width:
+                graph.add_edge(vertex, vertex + 1, 1 + 9 * random.random())
+    return graph
+
+def benchmark_shortest_paths(widths=(100, 300, 1000), queries=5):
+    """Point-to-point road routing: full Dijkstra vs early-exit Dijkstra vs A*"""
+    import random
+
+    print(f"\n{'Vertices':>10} {'full Dijkstra':>14} {'early exit':>12} {'A*':>10}   (ms per query)")
+    for width in widths:
+        graph = _road_grid(width)
+
+        def manhattan(vertex, target):
+            # Every road is at least 1 long, so grid distance never overestimates
+            return abs(vertex // width - target // width) + abs(vertex % width - target % width)
+
+        pairs = [(random.randrange(width * width), random.randrange(width * width)) for _ in range(queries)]
+        timings = []
+        for route in (lambda s, t: graph.dijkstra(s), graph.weighted_path,
+                      lambda s, t: graph.a_star(s, t, manhattan)):
+            start_time = time.perf_counter()
+            for source, target in pairs:
+                route(source, target)
+            timings.append((time.perf_counter() - start_time) / queries * 1e3)
+        print(f"{width * width:>10} {timings[0]:>14.1f} {timings[1]:>12.1f} {timings[2]:>10.1f}")
+
+def benchmark_point_to_point(num_vertices=10**5, average_degree=10, queries=20):
+    """Distance between two users: BFS until the target is found vs bidirectional BFS"""
+    import random
+
+    graph = _random_graph(num_vertices, num_vertices * average_degree // 2)
+    pairs = [(random.randrange(num_vertices), random.randrange(num_vertices)) for _ in range(queries)]
+    one_sided_visits = two_sided_visits = 0
+
+    start_time = time.perf_counter()
+    for source, target in pairs:
+        for visited, (vertex, _, _) in enumerate(graph.iter_bfs(source), 1):
+            if vertex == target:
+                break
+        one_sided_visits += visited
+    one_sided_time = (time.perf_counter() - start_time) / queries * 1e3
+
+    start_time = time.perf_counter()
+    for source, target in pairs:
+        two_sided_visits += graph._bidirectional_search(source, target)[1]
+    two_sided_time = (time.perf_counter() - start_time) / queries * 1e3
+
+    print(f"\n{num_vertices} users, average degree {average_degree}, {queries} random pairs:")
+    print(f"{'BFS to target':>22}: {one_sided_time:8.2f}ms  {one_sided_visits / queries:10.0f} vertices visited")
+    print(f"{'bidirectional BFS':>22}: {two_sided_time:8.2f}ms  {two_sided_visits / queries:10.0f} vertices visited")
+
+def benchmark_recommendations(num_vertices=2 * 10**4, average_degree=20, per_user_sample=500):
+    """Friend recommendations: recommend_friends per user vs CSRGraph.recommend_all batch"""
+    if np is None:
+        print("\nThis benchmark needs NumPy.")
+        return
+    graph = _random_graph(num_vertices, num_vertices * average_degree // 2)
+    frozen = graph.freeze()
+    graph.recommend_friends(0)  # builds the list-mode edge index once, outside the timings
+    print(f"\n{num_vertices} users, average degree {average_degree}, top-10:")
+    for metric in ("common", "jaccard", "adamic_adar"):
+        start_time = time.perf_counter()
+        for vertex in range(per_user_sample):
+            graph.recommend_friends(vertex, 10, metric)
+        per_user = per_user_sample / (time.perf_counter() - start_time)
+        start_time = time.perf_counter()
+        frozen.recommend_all(10, metric)
+        batch = num_vertices / (time.perf_counter() - start_time)
+        print(f"{metric:>12}: per-user {per_user:>10.0f} users/s   batch {batch:>10.0f} users/s")
+
+def benchmark_connectivity(num_vertices=10**5, num_edges=6 * 10**4, queries=10**4, bfs_queries=20):
+    """Are u and v connected? BFS per query vs incremental union-find"""
+    import random
+
+    start_time = time.perf_counter()
+    graph = _random_graph(num_vertices, num_edges)
+    build_time = time.perf_counter() - start_time
+    pairs = [(random.randrange(num_vertices), random.randrange(num_vertices)) for _ in range(queries)]
+
+    start_time = time.perf_counter()
+    for source, target in pairs[:bfs_queries]:
+        any(vertex == target for vertex, _, _ in graph.iter_bfs(source))
+    bfs_time = (time.perf_counter() - start_time) / bfs_queries * 1e6
+
+    graph.component_count()
+    start_time = time.perf_counter()
+    for source, target in pairs:
+        graph.connected(source, target)
+    union_find_time = (time.perf_counter() - start_time) / queries * 1e6
+
+    graph.remove_edge(*next(graph.iter_edges()))
+    start_time = time.perf_counter()
+    graph.component_count()
+    rebuild_time = (time.perf_counter() - start_time) * 1e3
+
+    print(f"\n{num_vertices} vertices, {num_edges} random edges, {graph.component_count()} components:")
+    print(f"{'BFS per query':>24}: {bfs_time:12.1f}us per query")
+    print(f"{'union-find':>24}: {union_find_time:12.2f}us per query")
+    print(f"{'build (with unions)':>24}: {build_time * 1e3:12.1f}ms")
+    print(f"{'rebuild after removal':>24}: {rebuild_time:12.1f}ms, once, on the next query")
+
+def benchmark_centrality(num_vertices=2 * 10**5, num_edges=10**6, samples=16):
+    """PageRank, degree and sampled betweenness centrality on a 10^6-edge directed graph"""
+    if np is None:
+        print("\nThis benchmark needs NumPy.")
+        return
+    graph = _random_graph(num_vertices, num_edges, directed=True)
+    frozen = graph.freeze()
+    print(f"\n{num_vertices} vertices, {num_edges} directed edges:")
+
+    # One power-iteration step in pure Python, for comparison with the vectorized step
+    rank = dict.fromkeys(graph.graph, 1 / num_vertices)
+    start_time = time.perf_counter()
+    spread = dict.fromkeys(graph.graph, 0.0)
+    for vertex, neighbors in graph.graph.items():
+        if neighbors:
+            share = rank[vertex] / len(neighbors)
+            for neighbor in neighbors:
+                spread[neighbor] += share
+    python_step = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    frozen.pagerank(max_iter=1)
+    numpy_step = time.perf_counter() - start_time
+    start_time = time.perf_counter()
+    frozen.pagerank()
+    pagerank_time = time.perf_counter() - start_time
+    print(f"{'PageRank step':>28}: Python {python_step * 1e3:8.1f}ms   NumPy {numpy_step * 1e3:8.1f}ms")
+    print(f"{'PageRank to tol=1e-6':>28}: {pagerank_time * 1e3:8.1f}ms")
+
+    start_time = time.perf_counter()
+    frozen.degree_centrality()
+    print(f"{'degree centrality':>28}: {(time.perf_counter() - start_time) * 1e3:8.1f}ms")
+
+    start_time = time.perf_counter()
+    frozen.betweenness(samples=samples, seed=0)
+    sampled_time = time.perf_counter() - start_time
+    print(f"{f'betweenness ({samples} sources)':>28}: {sampled_time * 1e3:8.1f}ms")
+    print(f"{'exact betweenness (est.)':>28}: {sampled_time / samples * num_vertices / 60:8.1f}min")
+
+def benchmark_parallel_bfs(num_vertices=5 * 10**5, num_edges=3 * 10**6, max_processes=None):
+    """Serial bfs vs ParallelBFS across 1..N worker processes on one large random graph"""
+    if np is None:
+        print("\nThis benchmark needs NumPy.")
+        return
+    graph = _random_graph(num_vertices, num_edges)
+    frozen = graph.freeze()
+    cores = max_processes or os.cpu_count() or 1
+    print(f"\n{num_vertices} vertices, {num_edges} edges, {os.cpu_count()} CPU core(s):")
+
+    start_time = time.perf_counter()
+    graph.bfs(0)
+    print(f"{'Graph.bfs (pure Python)':>28}: {(time.perf_counter() - start_time) * 1e3:8.1f}ms")
+    start_time = time.perf_counter()
+    frozen.bfs_distances(0)
+    print(f"{'CSRGraph.bfs_distances':>28}: {(time.perf_counter() - start_time) * 1e3:8.1f}ms")
+
+    # Powers of two up to the core count, plus the core count itself
+    for processes in sorted({cores} | {2**i for i in range(cores.bit_length()) if 2**i < cores}):
+        start_time = time.perf_counter()
+        with ParallelBFS(frozen, processes) as search:
+            setup_time = time.perf_counter() - start_time
+            start_time = time.perf_counter()
+            search.distances(0)
+            search_time = time.perf_counter() - start_time
+        label = f"ParallelBFS, {processes} process{'es' if processes > 1 else ''}"
+        print(f"{label:>28}: {search_time * 1e3:8.1f}ms  (+{setup_time * 1e3:.0f}ms pool and shared-memory setup)")
+    if cores == 1:
+        print("Only one core available: the pool can only add overhead here.")
+
+def benchmark_edge_list_ingest(num_vertices=10**5, num_edges=10**6):
+    """Loading an edge-list file: add_edge per line vs bulk from_edge_list vs mapped snapshot"""
+    if np is None:
+        print("\nThis benchmark needs NumPy.")
+        return
+    import random
+    import tempfile
+
+    directory = tempfile.mkdtemp()
+    text_path = os.path.join(directory, "edges.txt")
+    snapshot_path = os.path.join(directory, "graph.csr")
+    with open(text_path, "w") as f:
+        for _ in range(num_edges):
+            f.write(f"user{random.randrange(num_vertices)} user{random.randrange(num_vertices)}\n")
+    print(f"\n{num_edges} edges between {num_vertices} named vertices:")
+
+    start_time = time.perf_counter()
+    graph = Graph()
+    with open(text_path) as f:
+        for line in f:
+            source, target = line.split()
+            graph.add_edge(source, target)
+    loop_time = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    frozen = CSRGraph.from_edge_list(text_path)
+    csr_time = time.perf_counter() - start_time
+    bulk_times = {}
+    for adjacency in ("list", "dict"):
+        start_time = time.perf_counter()
+        Graph.from_edge_list(text_path, adjacency=adjacency)
+        bulk_times[adjacency] = time.perf_counter() - start_time
+
+    frozen.save(snapshot_path)
+    start_time = time.perf_counter()
+    loaded = CSRGraph.load(snapshot_path)
+    loaded.neighbor_ids(0)
+    load_time = time.perf_counter() - start_time
+
+    print(f"{'add_edge per line':>30}: {loop_time:8.2f}s")
+    for adjacency, bulk_time in bulk_times.items():
+        print(f"{f'Graph.from_edge_list ({adjacency})':>30}: {bulk_time:8.2f}s")
+    print(f"{'CSRGraph.from_edge_list':>30}: {csr_time:8.2f}s")
+    print(f"{'CSRGraph.load (mmap)':>30}: {load_time * 1e3:8.3f}ms")
+    print(f"Text file {os.path.getsize(text_path) / 2**20:.1f}MB, snapshot {os.path.getsize(snapshot_path) / 2**20:.1f}MB")
+    print("Bulk loads parse and intern each line once, then build every adjacency row in one pass;")
+    print("a snapshot reopens without parsing at all.")
+    del graph, frozen, loaded
+    os.remove(text_path)
+    os.remove(snapshot_path)
+    os.rmdir(directory)
+
+GRAPH_BENCHMARKS = [
+    ("Frozen CSR vs dict-of-lists (memory, BFS, degrees)", benchmark_csr),
+    ("Edge listing (list scan vs get_edges)", benchmark_get_edges),
+    ("Adjacency modes (list vs dict: edge and hub removal)", benchmark_adjacency_modes),
+    ("Shortest paths on a road grid (Dijkstra vs A*)", benchmark_shortest_paths),
+    ("Point-to-point distance (BFS vs bidirectional BFS)", benchmark_point_to_point),
+    ("Friend recommendations (per user vs batch)", benchmark_recommendations),
+    ("Connectivity queries (BFS vs union-find)", benchmark_connectivity),
+    ("Centrality on 10^6 edges (PageRank, degree, betweenness)", benchmark_centrality),
+    ("Parallel BFS scaling (1..N processes)", benchmark_parallel_bfs),
+    ("Edge-list ingest (add_edge loop vs bulk load vs snapshot)", benchmark_edge_list_ingest),
+]
+
+def graph_benchmark_menu():
+    print("\nPerformance Benchmarks:")
+    for i, (name, _) in enumerate(GRAPH_BENCHMARKS, 1):
+        print(f"{i}. {name}")
+    choice = input(f"\nChoose a benchmark (1-{len(GRAPH_BENCHMARKS)}): ")
+    if choice.isdigit() and 1 <= int(choice) <= len(GRAPH_BENCHMARKS):
+        GRAPH_BENCHMARKS[int(choice) - 1][1]()
+    else:
+        print("Invalid choice")
+
 def clear_screen():
     import os
     os.system('clear' if os.name == 'posix' else 'cls')
@@ -135,6 +1443,24 @@ def simulate_social_network():
     print(f"\nFriend Suggestions for {start_user} (using BFS):")
     print(" -> ".join(social_graph.bfs(start_user)))
 
+    print(f"\nRecommended friends for {start_user} (ranked by mutual friends):")
+    for user, mutual in social_graph.recommend_friends(start_user, k=3):
+        print(f"  {user}: {mutual:.0f} mutual friend(s)")
+
+    path = social_graph.shortest_path("Bob", "David")
+    print("\nHow is Bob connected to David? (bidirectional BFS)")
+    print(" -> ".join(path))
+    print(f"Degrees of separation: {social_graph.degrees_of_separation('Bob', 'David')}")
+
+    print(f"\nFriend circles (union-find): {social_graph.component_count()}")
+    print(f"Everyone reachable from {start_user}: {social_graph.component_size(start_user) == len(users)}")
+
+    if np is not None:
+        print("\nMost influential users (PageRank):")
+        ranking = sorted(social_graph.pagerank().items(), key=lambda item: item[1], reverse=True)
+        for user, score in ranking[:3]:
+            print(f"  {user}: {score:.3f}")
+
 def guided_graph_tutorial():
     clear_screen()
     print("\n=== Welcome to the Graph Tutorial! ===")
@@ -288,9 +1614,10 @@ def interactive_graph_learning():
         print("8. Quiz me!")
         print("9. Simulate social network")
         print("10. Guided Tutorial")
+        print("11. Performance benchmarks")
         print("0. Exit")
 
-        choice = input("\nChoose an operation (0-10): ")
+        choice = input("\nChoose an operation (0-11): ")
 
         if choice == "0":
             print("\nThanks for learning about graphs! Keep practicing!")
@@ -338,7 +1665,7 @@ def interactive_graph_learning():
                 print("\nGraph is empty!")
 
         elif choice == "6":
-            graph = Graph(directed=graph.directed)
+            graph = Graph(directed=graph.directed, adjacency=graph.adjacency)
             print("\nCreated new empty graph!")
 
         elif choice == "7":
@@ -368,6 +1695,9 @@ def interactive_graph_learning():
         elif choice == "10":
             guided_graph_tutorial()
 
+        elif choice == "11":
+            graph_benchmark_menu()
+
         input("\nPress Enter to continue...")
 
 if __name__ == "__main__":
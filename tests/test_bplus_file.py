@@ -0,0 +1,46 @@
+"""Page files written by BPlusTree.save() and opened by MappedBPlusTree"""
+
+import pytest
+
+from tree_example import BPlusTree, MappedBPlusTree
+
+
+def test_round_trip(tmp_path):
+    path = tmp_path / "index.bpt"
+    items = [(key, key * 10) for key in range(0, 3000, 3)]
+    BPlusTree.bulk_load(items, order=8).save(path)
+    with MappedBPlusTree(path) as mapped:
+        assert len(mapped) == len(items)
+        assert mapped.get(2997) == 29970
+        assert 1 not in mapped
+
+
+def test_close_with_open_iterator(tmp_path):
+    path = tmp_path / "index.bpt"
+    BPlusTree.bulk_load([(key, key) for key in range(100)], order=4).save(path)
+    mapped = MappedBPlusTree(path)
+    scan = mapped.iter_range()
+    assert next(scan) == (0, 0)
+    mapped.close()
+
+    with MappedBPlusTree(path) as mapped:
+        scan = mapped.iter_range(10, 50)
+        assert [next(scan) for _ in range(3)] == [(10, 10), (11, 11), (12, 12)]
+
+
+@pytest.mark.parametrize("items", [[(1, "a")], [(1, 2**63)], [(0.5, 1)]])
+def test_bad_values_leave_existing_file(tmp_path, items):
+    path = tmp_path / "index.bpt"
+    BPlusTree.bulk_load([(1, 1)]).save(path)
+    before = path.read_bytes()
+    with pytest.raises(TypeError):
+        BPlusTree.bulk_load(items).save(path)
+    assert path.read_bytes() == before
+    assert [entry.name for entry in tmp_path.iterdir()] == ["index.bpt"]
+
+
+def test_bad_values_write_nothing(tmp_path):
+    path = tmp_path / "index.bpt"
+    with pytest.raises(TypeError):
+        BPlusTree.bulk_load([(1, None)]).save(path)
+    assert list(tmp_path.iterdir()) == []
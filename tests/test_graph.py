@@ -0,0 +1,35 @@
+"""Graph behaves the same in both adjacency modes"""
+
+import pytest
+
+from graph_example import Graph
+
+MULTIGRAPH = [(1, 2), (1, 2), (1, 3), (2, 1), (3, 1), (3, 3)]
+
+
+def build(edges, directed=True, adjacency="list"):
+    graph = Graph(directed=directed, adjacency=adjacency)
+    for vertex1, vertex2 in edges:
+        graph.add_edge(vertex1, vertex2)
+    return graph
+
+
+@pytest.mark.parametrize("directed", [True, False])
+def test_freeze_keeps_parallel_edges(directed):
+    pytest.importorskip("numpy")
+    frozen = {mode: build(MULTIGRAPH, directed, mode).freeze() for mode in ("list", "dict")}
+    assert frozen["list"].num_edges() == frozen["dict"].num_edges() == 6
+    assert frozen["list"].offsets.tolist() == frozen["dict"].offsets.tolist()
+    assert frozen["list"].pagerank().tolist() == pytest.approx(frozen["dict"].pagerank().tolist())
+    thawed = frozen["dict"].thaw("dict")
+    assert sorted(thawed.get_edges()) == sorted(build(MULTIGRAPH, directed, "dict").get_edges())
+
+
+@pytest.mark.parametrize("directed", [True, False])
+@pytest.mark.parametrize("adjacency", ["list", "dict"])
+def test_degree_centrality_counts_distinct_neighbors(directed, adjacency):
+    graph = build(MULTIGRAPH, directed, adjacency)
+    assert graph.degree_centrality() == {1: 1.0, 2: 0.5, 3: 0.5}
+    pytest.importorskip("numpy")
+    frozen = graph.freeze()
+    assert dict(zip(frozen.vertices, frozen.degree_centrality().tolist())) == {1: 1.0, 2: 0.5, 3: 0.5}
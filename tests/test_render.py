@@ -0,0 +1,28 @@
+"""BinaryTree.render() previews of trees too big to draw in full"""
+
+from tree_example import AVLTree, BinaryTree, Node
+
+
+def test_wide_tree_keeps_root_in_view():
+    rows = AVLTree.from_sorted(range(10**5)).render(max_width=100).split("\n")
+    assert rows[0].strip() == "50000"
+    assert rows[-1].startswith("… subtrees too wide")
+    for row in rows[:-1]:
+        assert len(row) <= 100
+        assert row.strip(" …")
+
+
+def test_tree_that_fits_is_drawn_in_full():
+    tree = AVLTree.from_sorted(range(15))
+    assert tree.render(max_width=100) == tree.render()
+
+
+def test_deep_chain_is_cut_off():
+    tree = BinaryTree()
+    nodes = [Node(i) for i in range(10**5)]
+    for parent, child in zip(nodes, nodes[1:]):
+        parent.left = child
+    tree.root = nodes[0]
+    rows = tree.render(max_width=12).split("\n")
+    assert rows[0].strip() == "0"
+    assert rows[-2].strip() == "…┘"
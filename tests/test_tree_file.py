@@ -0,0 +1,128 @@
+"""Round trips through BinaryTree.save() and BinaryTree.load()"""
+
+import random
+
+import pytest
+
+from tree_example import BinaryTree, Node
+
+
+def random_tree(values, seed=0):
+    """Tree of the given values with an irregular shape: each node hangs off a random free slot"""
+    rng = random.Random(seed)
+    tree = BinaryTree()
+    if not values:
+        return tree
+    nodes = [Node(value) for value in values]
+    free = [(nodes[0], "left"), (nodes[0], "right")]
+    for node in nodes[1:]:
+        parent, side = free.pop(rng.randrange(len(free)))
+        setattr(parent, side, node)
+        free += [(node, "left"), (node, "right")]
+    tree.root = nodes[0]
+    return tree
+
+
+def shape(node):
+    """Nested (data, left, right) tuples, so two trees compare equal only if values and shape match"""
+    if node is None:
+        return None
+    return (node.data, shape(node.left), shape(node.right))
+
+
+@pytest.mark.parametrize("lazy", [True, False])
+@pytest.mark.parametrize("values", [
+    list(range(-20, 80)),
+    [0.5, -1.25, 3.0, float("inf"), 1e300],
+    ["root", "", "ünïcödé", "a/b", "x" * 1000],
+    [7],
+    [],
+], ids=["int", "float", "str", "single", "empty"])
+def test_round_trip(tmp_path, values, lazy):
+    tree = random_tree(values)
+    path = tmp_path / "tree.bin"
+    tree.save(path)
+    loaded = BinaryTree.load(path, lazy=lazy)
+    assert shape(loaded.root) == shape(tree.root)
+    if values:
+        assert type(loaded.root.data) is type(values[0])
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_irregular_shapes(tmp_path, seed):
+    tree = random_tree(list(range(200)), seed)
+    path = tmp_path / "tree.bin"
+    tree.save(path)
+    assert shape(BinaryTree.load(path).root) == shape(tree.root)
+    assert shape(BinaryTree.load(path, lazy=False).root) == shape(tree.root)
+
+
+def test_degenerate_chains(tmp_path):
+    for side in ("left", "right"):
+        tree = BinaryTree()
+        tree.root = node = Node(0)
+        for value in range(1, 50):
+            setattr(node, side, Node(value))
+            node = getattr(node, side)
+        path = tmp_path / f"{side}.bin"
+        tree.save(path)
+        assert shape(BinaryTree.load(path).root) == shape(tree.root)
+
+
+def test_eager_load_is_mutable(tmp_path):
+    path = tmp_path / "tree.bin"
+    random_tree([1, 2, 3]).save(path)
+    tree = BinaryTree.load(path, lazy=False)
+    tree.insert(4)
+    assert tree.search(4)
+
+
+def test_lazy_traversal_keeps_no_nodes(tmp_path):
+    path = tmp_path / "tree.bin"
+    random_tree(list(range(500))).save(path)
+    tree = BinaryTree.load(path)
+    assert sorted(tree.iter_inorder()) == list(range(500))
+    assert list(tree.iter_postorder()) == list(random_tree(list(range(500))).iter_postorder())
+    assert len(tree._tree_file._nodes) <= 1
+
+
+def test_lazy_morris_falls_back_to_stack(tmp_path):
+    path = tmp_path / "tree.bin"
+    original = random_tree(list(range(100)))
+    original.save(path)
+    tree = BinaryTree.load(path)
+    assert list(tree.iter_inorder(morris=True)) == list(original.iter_inorder())
+    assert list(tree.iter_preorder(morris=True)) == list(original.iter_preorder())
+
+
+def test_close(tmp_path):
+    path = tmp_path / "tree.bin"
+    random_tree([1, 2, 3]).save(path)
+    with BinaryTree.load(path) as tree:
+        assert tree.root.data == 1
+    assert tree.root is None
+    tree.close()
+    BinaryTree.load(path, lazy=False).close()
+
+
+def test_lazy_load_is_read_only(tmp_path):
+    path = tmp_path / "tree.bin"
+    random_tree([1, 2, 3]).save(path)
+    root = BinaryTree.load(path).root
+    for attribute in ("data", "left", "right"):
+        with pytest.raises(TypeError):
+            setattr(root, attribute, None)
+
+
+@pytest.mark.parametrize("values", [[1, 2.5], [1, "a"], [None], [(1, 2)]])
+def test_unsupported_values(tmp_path, values):
+    path = tmp_path / "tree.bin"
+    with pytest.raises(TypeError):
+        random_tree(values).save(path)
+
+
+def test_not_a_tree_file(tmp_path):
+    path = tmp_path / "tree.bin"
+    path.write_bytes(b"\0" * 64)
+    with pytest.raises(ValueError):
+        BinaryTree.load(path)
@@ -20,8 +20,32 @@ Operations:
 - insert(data) : Add new node
 - search(data) : Find node with data
 - delete(data) : Remove node with data
+
+Array Layout (CompleteBinaryTree):
+-------------------------------
+index:  0  1  2  3  4  5  6
+value: [7, 3, 9, 1, 5, 8, 10]
+children of i → 2i+1, 2i+2    parent of i → (i-1)//2
 """
 
+import array
+import bisect
+import io
+import math
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import time
+import weakref
+from collections import deque
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 class Node:
     def __init__(self, data):
         self.data = data
@@ -29,10 +53,56 @@ class Node:
         self.right = None
 
 class BinaryTree:
+    FILE_MAGIC = b"BTF1"
+    FILE_HEADER = struct.Struct("<4scc2xQQ")  # magic, value type, index type, node count, string blob length
+
     def __init__(self):
+        self._ancestor_index = None
+        self._tree_file = None  # set by load(lazy=True) until close()
         self.root = None
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """Release the file mapping behind a lazily loaded tree; the tree is empty afterwards"""
+        if self._tree_file is not None:
+            self.root = None
+            self._tree_file.close()
+            self._tree_file = None
+
+    @property
+    def root(self):
+        return self._root
+
+    @root.setter
+    def root(self, node):
+        # Any new root means a different tree: cached indexes describe the old one
+        self._root = node
+        self.invalidate_indexes()
+
+    def invalidate_indexes(self):
+        """Drop cached query indexes; mutating methods call this, and so should code that relinks Nodes by hand"""
+        self._ancestor_index = None
+
+    def _ancestors(self):
+        if self._ancestor_index is None:
+            self._ancestor_index = AncestorIndex(self.root)
+        return self._ancestor_index
+
+    def is_ancestor(self, ancestor, descendant):
+        """O(1) after a one-time O(n log n) index build; a node counts as its own ancestor"""
+        return self._ancestors().is_ancestor(ancestor, descendant)
+
+    def lowest_common_ancestor(self, first, second):
+        """O(1) after a one-time O(n log n) index build"""
+        return self._ancestors().lowest_common_ancestor(first, second)
+
     def insert(self, data):
+        self.invalidate_indexes()
         if not self.root:
             self.root = Node(data)
             return
@@ -64,63 +134,2077 @@ class BinaryTree:
                 queue.append(node.right)
         return False
 
-    def print_tree(self):
+    def render(self, max_depth=None, max_width=None):
+        """Lay the tree out in two passes: subtree widths bottom-up, then rows in level order.
+
+        max_depth and max_width give a cheap preview of a huge tree: levels below max_depth are
+        never visited, and with max_width the layout is squeezed into that many columns. The root
+        stays in view, and a subtree that does not fit the columns left for it is drawn as … at
+        its slot instead of being visited.
+        """
         if not self.root:
             return "Empty tree"
-        
-        def get_height(node):
-            if not node:
-                return 0
-            return 1 + max(get_height(node.left), get_height(node.right))
 
-        def print_level(node, level, space_count):
-            if not node:
-                return
-            if level == 1:
-                print(" " * space_count + str(node.data), end="")
-            elif level > 1:
-                print_level(node.left, level - 1, space_count)
-                print_level(node.right, level - 1, space_count)
+        def children(node, depth):
+            if max_depth is not None and depth + 1 >= max_depth:
+                return None, None
+            return node.left, node.right
 
-        height = get_height(self.root)
-        for i in range(1, height + 1):
-            space_count = 2 ** (height - i)
-            print_level(self.root, i, space_count)
-            print()
+        def label(node):
+            # Holding the node keeps its id() from being reused while the layout is keyed by it,
+            # which matters for proxies such as MappedNode that are created on access
+            if id(node) not in labels:
+                labels[id(node)] = node, str(node.data)
+            return labels[id(node)][1]
+
+        def slot_widths(left, right):
+            # A lone child keeps a one-column placeholder on its empty side, so ┌┘ and └┐ tell them apart
+            if not (left or right):
+                return 0, 0, 0
+            return widths[id(left)] if left else 1, widths[id(right)] if right else 1, 1
+
+        def natural_width(root, root_depth, cap):
+            """Width of the full layout of root's subtree, or None once it is known to exceed cap.
+
+            Every level adds at least two columns, so nothing deeper than cap / 2 is visited, and a
+            subtree that fits has no more nodes than columns.
+            """
+            label(root)
+            if id(root) in widths:
+                return widths[id(root)] if widths[id(root)] <= cap else None
+            if too_wide.get(id(root), -1) >= cap:
+                return None
+            stack = [(root, root_depth, False)]
+            while stack:
+                node, depth, expanded = stack.pop()
+                left, right = children(node, depth)
+                if not expanded:
+                    label(node)
+                    if 2 * (depth - root_depth) + 1 > cap or too_wide.get(id(node), -1) >= cap:
+                        too_wide[id(root)] = cap
+                        return None
+                    stack.append((node, depth, True))
+                    stack.extend((child, depth + 1, False) for child in (right, left) if child and id(child) not in widths)
+                    continue
+                left_width, right_width, gap = slot_widths(left, right)
+                width = max(len(label(node)), left_width + gap + right_width)
+                if width > cap:
+                    too_wide[id(node)] = too_wide[id(root)] = cap
+                    return None
+                widths[id(node)] = width
+            return widths[id(root)]
+
+        def center(node, x, width):
+            text = label(node)
+            return x + (width - len(text)) // 2 + (len(text) - 1) // 2
+
+        def line(segments):
+            parts, cursor = [], 0
+            for start, text in segments:
+                parts.append(" " * (start - cursor) + text)
+                cursor = start + len(text)
+            return "".join(parts).rstrip()
+
+        def budget_slots(left, right, width, depth):
+            # Split the columns of a subtree too wide to draw in full: a child that fits in its
+            # half gets exactly what it needs and its sibling gets the rest
+            if left and right:
+                available = width - 1
+                left_width = natural_width(left, depth + 1, available - 1)
+                if left_width is None or left_width > available // 2:
+                    right_width = natural_width(right, depth + 1, available - available // 2)
+                    left_width = available - right_width if right_width is not None else available // 2
+                return left_width, available - left_width, 1
+            if left:
+                return width - 2, 1, 1
+            return 1, width - 2, 1
+
+        labels, widths, too_wide = {}, {}, {}
+        # The root is always shown, even when its label alone is wider than max_width
+        columns = math.inf if max_width is None else max(max_width, len(label(self.root)))
+        root_width = natural_width(self.root, 0, columns)
+        buffer = io.StringIO()
+        label_row, branch_row = [], []
+        hidden = collapsed = False
+        # node, leftmost column, width, depth, whether the subtree is drawn at its full width
+        queue = deque([(self.root, 0, root_width or columns, 0, root_width is not None)])
+        current_depth = 0
+        while queue:
+            node, x, width, depth, full = queue.popleft()
+            if depth != current_depth:
+                buffer.write(line(label_row) + "\n" + line(branch_row) + "\n")
+                label_row, branch_row = [], []
+                current_depth = depth
+
+            text = label(node)
+            label_row.append((x + max(0, width - len(text)) // 2, text))
+            left, right = children(node, depth)
+            hidden = hidden or (not (left or right) and bool(node.left or node.right))
+            if not (left or right):
+                continue
+            if not full and width < 3:
+                collapsed = True
+                continue
+
+            if full:
+                left_width, right_width, gap = slot_widths(left, right)
+                child_x = x + (width - left_width - gap - right_width) // 2
+            else:
+                left_width, right_width, gap = budget_slots(left, right, width, depth)
+                child_x = x
+            parent_center = center(node, x, width)
+            low = high = parent_center
+            ends = {}
+            for child, slot_x, slot_width in ((left, child_x, left_width), (right, child_x + left_width + gap, right_width)):
+                if not child:
+                    continue
+                child_width = widths[id(child)] if full else natural_width(child, depth + 1, slot_width)
+                if child_width is not None:
+                    slot_x += (slot_width - child_width) // 2
+                    queue.append((child, slot_x, child_width, depth + 1, True))
+                    child_center = center(child, slot_x, child_width)
+                elif 3 <= slot_width and len(label(child)) <= slot_width:
+                    queue.append((child, slot_x, slot_width, depth + 1, False))
+                    child_center = center(child, slot_x, slot_width)
+                else:
+                    # No room for the label and a row of branches under it: the branch ends in … at the child's slot
+                    collapsed, child_center = True, slot_x + (slot_width - 1) // 2
+                    ends[child_center] = "…"
+                low, high = min(low, child_center), max(high, child_center)
+
+            branch = ["─"] * (high - low + 1)
+            if low < parent_center:
+                branch[0] = ends.get(low, "┌")
+            if high > parent_center:
+                branch[-1] = ends.get(high, "┐")
+            joint = {(True, True): "┴", (True, False): "┘", (False, True): "└", (False, False): "│"}
+            branch[parent_center - low] = joint[(low < parent_center, high > parent_center)]
+            branch_row.append((low, "".join(branch)))
+
+        buffer.write(line(label_row) + "\n")
+        if branch_row:
+            buffer.write(line(branch_row) + "\n")
+        if hidden:
+            buffer.write(f"… deeper levels hidden (max_depth={max_depth})\n")
+        if collapsed:
+            buffer.write(f"… subtrees too wide for max_width={max_width} shown as …\n")
+        return buffer.getvalue().rstrip("\n")
+
+    def print_tree(self, max_depth=None, max_width=None):
+        if not self.root:
+            return "Empty tree"
+        sys.stdout.write(self.render(max_depth, max_width) + "\n")
+
+    def iter_inorder(self, node=None, morris=False):
+        """Lazy Left→Root→Right; morris=True uses O(1) extra space instead of a stack
+
+        Morris threading rewrites child links, so read-only mapped trees always use the stack.
+        """
+        if node is None:
+            node = self.root
+        if morris and not isinstance(node, MappedNode):
+            yield from self._morris(node, preorder=False)
+            return
+        stack = []
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.data
+            node = node.right
+
+    def iter_preorder(self, node=None, morris=False):
+        """Lazy Root→Left→Right; morris=True uses O(1) extra space instead of a stack
+
+        Morris threading rewrites child links, so read-only mapped trees always use the stack.
+        """
+        if node is None:
+            node = self.root
+        if morris and not isinstance(node, MappedNode):
+            yield from self._morris(node, preorder=True)
+            return
+        stack = [node] if node else []
+        while stack:
+            node = stack.pop()
+            yield node.data
+            if node.right:
+                stack.append(node.right)
+            if node.left:
+                stack.append(node.left)
+
+    def iter_postorder(self, node=None):
+        """Lazy Left→Right→Root"""
+        if node is None:
+            node = self.root
+        stack = []
+        last_visited = None
+        while stack or node:
+            if node:
+                stack.append(node)
+                node = node.left
+            else:
+                top = stack[-1]
+                if top.right and last_visited is not top.right:
+                    node = top.right
+                else:
+                    yield top.data
+                    last_visited = stack.pop()
+
+    def _morris(self, node, preorder):
+        walk = self._morris_walk(node, preorder)
+        try:
+            for value in walk:
+                yield value
+        finally:
+            # Stopping early leaves temporary threads in place: finish the walk to remove them
+            for _ in walk:
+                pass
+
+    @staticmethod
+    def _morris_walk(current, preorder):
+        # Thread each left subtree's rightmost node back to its ancestor instead of using a stack
+        while current:
+            if not current.left:
+                yield current.data
+                current = current.right
+                continue
+            predecessor = current.left
+            while predecessor.right and predecessor.right is not current:
+                predecessor = predecessor.right
+            if not predecessor.right:
+                if preorder:
+                    yield current.data
+                predecessor.right = current
+                current = current.left
+            else:
+                predecessor.right = None
+                if not preorder:
+                    yield current.data
+                current = current.right
 
     def inorder_traversal(self, node=None, result=None):
         if result is None:
             result = []
-        if node is None:
-            node = self.root
-        if node:
-            self.inorder_traversal(node.left, result)
-            result.append(node.data)
-            self.inorder_traversal(node.right, result)
+        result.extend(self.iter_inorder(node))
         return result
 
     def preorder_traversal(self, node=None, result=None):
         if result is None:
             result = []
-        if node is None:
-            node = self.root
-        if node:
-            result.append(node.data)
-            self.preorder_traversal(node.left, result)
-            self.preorder_traversal(node.right, result)
+        result.extend(self.iter_preorder(node))
         return result
 
     def postorder_traversal(self, node=None, result=None):
         if result is None:
             result = []
+        result.extend(self.iter_postorder(node))
+        return result
+
+    def save(self, path):
+        """Write the tree as level-order columns: child-shape bytes, first-child indexes, values"""
+        values, shapes, first_child = [], bytearray(), []
+        next_index = 1
+        queue = deque([self.root] if self.root else [])
+        while queue:
+            node = queue.popleft()
+            values.append(node.data)
+            first_child.append(next_index)
+            shape = 0
+            for bit, child in enumerate((node.left, node.right)):
+                if child:
+                    shape |= 1 << bit
+                    queue.append(child)
+                    next_index += 1
+            shapes.append(shape)
+
+        if all(type(value) is int for value in values):
+            value_code, payload = b"q", [array.array("q", values).tobytes()]
+        elif all(type(value) is float for value in values):
+            value_code, payload = b"d", [array.array("d", values).tobytes()]
+        elif all(type(value) is str for value in values):
+            encoded = [value.encode() for value in values]
+            offsets = array.array("Q", [0])
+            for chunk in encoded:
+                offsets.append(offsets[-1] + len(chunk))
+            value_code, payload = b"s", [offsets.tobytes(), b"".join(encoded)]
+        else:
+            # Mixed int/float would come back as all float, so it is refused rather than widened
+            raise TypeError("save() supports trees whose values are all int, all float or all str")
+
+        index_code = b"I" if len(values) < 2**32 else b"Q"
+        columns = [bytes(shapes), array.array(index_code.decode(), first_child).tobytes()] + payload
+        with open(path, "wb") as f:
+            blob_length = len(payload[-1]) if value_code == b"s" else 0
+            f.write(self.FILE_HEADER.pack(self.FILE_MAGIC, value_code, index_code, len(values), blob_length))
+            for column in columns:
+                f.write(column)
+                f.write(b"\0" * (-len(column) % 8))
+
+    @staticmethod
+    def load(path, lazy=True):
+        """Open a save() file; lazy=True maps it read-only and only decodes the nodes you visit.
+
+        A lazily loaded tree keeps the file open until close(), or the end of a with block.
+        """
+        tree_file = _TreeFile(path)
+        tree = BinaryTree()
+        if not lazy:
+            nodes = [Node(tree_file.value(i)) for i in range(tree_file.count)]
+            for i, node in enumerate(nodes):
+                shape, child = tree_file.shapes[i], tree_file.first_child[i]
+                if shape & 1:
+                    node.left = nodes[child]
+                    child += 1
+                if shape & 2:
+                    node.right = nodes[child]
+            tree.root = nodes[0] if nodes else None
+            tree_file.close()
+        else:
+            tree._tree_file = tree_file
+            tree.root = tree_file.node(0) if tree_file.count else None
+        return tree
+
+class AncestorIndex:
+    """Euler tour + sparse table over a tree of Nodes, keyed by node data (first occurrence in preorder)"""
+
+    def __init__(self, root):
+        self.order = {}         # data -> preorder number
+        self.subtree_end = []   # preorder number -> last preorder number inside its subtree
+        self.first_visit = []   # preorder number -> first position in the Euler tour
+        self.tour, self.depths = [], []
+
+        # A node is re-entered after each child, so it appears 1 + children times in the tour
+        stack = [(root, 0, 0, None)] if root else []
+        while stack:
+            node, depth, step, number = stack.pop()
+            if number is None:
+                number = len(self.subtree_end)
+                self.order.setdefault(node.data, number)
+                self.subtree_end.append(number)
+                self.first_visit.append(len(self.tour))
+            self.tour.append(node.data)
+            self.depths.append(depth)
+
+            child = None
+            while child is None and step < 2:
+                child = (node.left, node.right)[step]
+                step += 1
+            if child:
+                stack.append((node, depth, step, number))
+                stack.append((child, depth + 1, 0, None))
+            else:
+                self.subtree_end[number] = len(self.subtree_end) - 1
+
+        # sparse[k][i]: tour position of the shallowest node in tour[i:i + 2**k]
+        self.sparse = [list(range(len(self.tour)))]
+        span = 1
+        while 2 * span <= len(self.tour):
+            previous = self.sparse[-1]
+            self.sparse.append([
+                a if self.depths[a] <= self.depths[b] else b
+                for a, b in zip(previous, previous[span:])
+            ])
+            span *= 2
+
+    def _number(self, data):
+        try:
+            return self.order[data]
+        except KeyError:
+            raise KeyError(f"{data!r} is not in the tree") from None
+
+    def is_ancestor(self, ancestor, descendant):
+        a, d = self._number(ancestor), self._number(descendant)
+        return a <= d <= self.subtree_end[a]
+
+    def lowest_common_ancestor(self, first, second):
+        low = self.first_visit[self._number(first)]
+        high = self.first_visit[self._number(second)]
+        if low > high:
+            low, high = high, low
+        level = (high - low + 1).bit_length() - 1
+        a, b = self.sparse[level][low], self.sparse[level][high - (1 << level) + 1]
+        return self.tour[a if self.depths[a] <= self.depths[b] else b]
+
+class _TreeFile:
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, value_code, index_code, self.count, blob_length = BinaryTree.FILE_HEADER.unpack_from(self._mmap, 0)
+        if magic != BinaryTree.FILE_MAGIC:
+            self._mmap.close()
+            raise ValueError(f"{path} is not a BinaryTree file")
+
+        # Zero-copy views over each column; offsets are padded to 8 bytes like save() wrote them
+        view = memoryview(self._mmap)
+        offset = BinaryTree.FILE_HEADER.size
+
+        def column(length, code=None):
+            nonlocal offset
+            data = view[offset:offset + length]
+            offset += length + (-length % 8)
+            return data.cast(code) if code else data
+
+        index_code = index_code.decode()
+        self.shapes = column(self.count)
+        self.first_child = column(self.count * struct.calcsize(index_code), index_code)
+        self.strings = value_code == b"s"
+        if self.strings:
+            self.offsets = column((self.count + 1) * 8, "Q")
+            self.values = column(blob_length)
+        else:
+            self.values = column(self.count * 8, value_code.decode())
+        self._nodes = weakref.WeakValueDictionary()
+
+    def close(self):
+        for name in ("shapes", "first_child", "values", "offsets"):
+            if hasattr(self, name):
+                getattr(self, name).release()
+        self._mmap.close()
+
+    def value(self, index):
+        if self.strings:
+            return str(self.values[self.offsets[index]:self.offsets[index + 1]], "utf-8")
+        return self.values[index]
+
+    def node(self, index):
+        # One proxy per index while anything still refers to it, so identity checks in the
+        # traversals keep working without every visited node staying cached
+        node = self._nodes.get(index)
         if node is None:
-            node = self.root
-        if node:
-            self.postorder_traversal(node.left, result)
-            self.postorder_traversal(node.right, result)
-            result.append(node.data)
+            node = self._nodes[index] = MappedNode(self, index)
+        return node
+
+    def child(self, index, side):
+        shape = self.shapes[index]
+        if not shape & (1 << side):
+            return None
+        return self.node(self.first_child[index] + (side and shape & 1))
+
+def _read_only(self, value):
+    raise TypeError("memory-mapped trees are read-only; use BinaryTree.load(path, lazy=False) to modify")
+
+class MappedNode:
+    """Node proxy that reads data and children from a memory-mapped BinaryTree file on access"""
+
+    __slots__ = ("_file", "_index", "__weakref__")
+
+    def __init__(self, tree_file, index):
+        self._file = tree_file
+        self._index = index
+
+    data = property(lambda self: self._file.value(self._index), _read_only)
+    left = property(lambda self: self._file.child(self._index, 0), _read_only)
+    right = property(lambda self: self._file.child(self._index, 1), _read_only)
+
+class PackedBinaryTree:
+    """BinaryTree stored as parallel typed arrays of data and left/right child indexes"""
+
+    NIL = -1
+
+    def __init__(self, typecode="q"):
+        # typecode=None keeps data in a plain list so any Python value can be stored
+        self.typecode = typecode
+        self.data = array.array(typecode) if typecode else []
+        self.left = array.array("i")
+        self.right = array.array("i")
+        self.root = self.NIL
+        self.free = []  # deleted slots, reused by the next insert
+
+    def __len__(self):
+        return len(self.data) - len(self.free)
+
+    @classmethod
+    def from_level_order(cls, values, typecode="q"):
+        """Same shape as repeated insert(), built in O(n)"""
+        tree = cls(typecode)
+        tree.data = array.array(typecode, values) if typecode else list(values)
+        n = len(tree.data)
+        tree.left = array.array("i", [i if i < n else cls.NIL for i in range(1, 2 * n, 2)])
+        tree.right = array.array("i", [i if i < n else cls.NIL for i in range(2, 2 * n + 1, 2)])
+        tree.root = 0 if n else cls.NIL
+        return tree
+
+    def _new_node(self, value):
+        if self.free:
+            index = self.free.pop()
+            self.data[index] = value
+            self.left[index] = self.right[index] = self.NIL
+            return index
+        self.data.append(value)
+        self.left.append(self.NIL)
+        self.right.append(self.NIL)
+        return len(self.data) - 1
+
+    def _level_order(self):
+        queue = deque([self.root] if self.root != self.NIL else [])
+        while queue:
+            index = queue.popleft()
+            yield index
+            if self.left[index] != self.NIL:
+                queue.append(self.left[index])
+            if self.right[index] != self.NIL:
+                queue.append(self.right[index])
+
+    def insert(self, data):
+        if self.root == self.NIL:
+            self.root = self._new_node(data)
+            return
+        for index in self._level_order():
+            if self.left[index] == self.NIL:
+                self.left[index] = self._new_node(data)
+                return
+            if self.right[index] == self.NIL:
+                self.right[index] = self._new_node(data)
+                return
+
+    def search(self, data):
+        return any(self.data[index] == data for index in self._level_order())
+
+    def delete(self, data):
+        """Replace the value with the deepest, rightmost node's value, then free that slot"""
+        target = parent = last = self.NIL
+        parents = {self.root: self.NIL}
+        for index in self._level_order():
+            if target == self.NIL and self.data[index] == data:
+                target = index
+            for child in (self.left[index], self.right[index]):
+                if child != self.NIL:
+                    parents[child] = index
+            last = index
+        if target == self.NIL:
+            return False
+
+        self.data[target] = self.data[last]
+        parent = parents[last]
+        if parent == self.NIL:
+            self.root = self.NIL
+        elif self.right[parent] == last:
+            self.right[parent] = self.NIL
+        else:
+            self.left[parent] = self.NIL
+        if not self.typecode:
+            self.data[last] = None
+        self.free.append(last)
+        return True
+
+    def iter_inorder(self):
+        stack, index = [], self.root
+        while stack or index != self.NIL:
+            while index != self.NIL:
+                stack.append(index)
+                index = self.left[index]
+            index = stack.pop()
+            yield self.data[index]
+            index = self.right[index]
+
+    def iter_preorder(self):
+        stack = [self.root] if self.root != self.NIL else []
+        while stack:
+            index = stack.pop()
+            yield self.data[index]
+            if self.right[index] != self.NIL:
+                stack.append(self.right[index])
+            if self.left[index] != self.NIL:
+                stack.append(self.left[index])
+
+    def iter_postorder(self):
+        stack, index, last_visited = [], self.root, self.NIL
+        while stack or index != self.NIL:
+            if index != self.NIL:
+                stack.append(index)
+                index = self.left[index]
+            else:
+                top = stack[-1]
+                if self.right[top] != self.NIL and self.right[top] != last_visited:
+                    index = self.right[top]
+                else:
+                    yield self.data[top]
+                    last_visited = stack.pop()
+
+    def inorder_traversal(self):
+        return list(self.iter_inorder())
+
+    def preorder_traversal(self):
+        return list(self.iter_preorder())
+
+    def postorder_traversal(self):
+        return list(self.iter_postorder())
+
+class CompleteBinaryTree:
+    def __init__(self):
+        self.nodes = []
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def insert(self, data):
+        # The next free level-order slot is always the end of the array
+        self.nodes.append(data)
+
+    def parent(self, index):
+        if index <= 0 or index >= len(self.nodes):
+            return None
+        return (index - 1) // 2
+
+    def left_child(self, index):
+        child = 2 * index + 1
+        return child if child < len(self.nodes) else None
+
+    def right_child(self, index):
+        child = 2 * index + 2
+        return child if child < len(self.nodes) else None
+
+    def search(self, data):
+        return data in self.nodes
+
+    def get_height(self):
+        return len(self.nodes).bit_length()
+
+    def print_tree(self):
+        if not self.nodes:
+            return "Empty tree"
+
+        height = self.get_height()
+        for i in range(1, height + 1):
+            space_count = 2 ** (height - i)
+            start = 2 ** (i - 1) - 1
+            for value in self.nodes[start:2 * start + 1]:
+                print(" " * space_count + str(value), end="")
+            print()
+
+    def inorder_traversal(self, index=0, result=None):
+        if result is None:
+            result = []
+        if index < len(self.nodes):
+            self.inorder_traversal(2 * index + 1, result)
+            result.append(self.nodes[index])
+            self.inorder_traversal(2 * index + 2, result)
+        return result
+
+    def preorder_traversal(self, index=0, result=None):
+        if result is None:
+            result = []
+        if index < len(self.nodes):
+            result.append(self.nodes[index])
+            self.preorder_traversal(2 * index + 1, result)
+            self.preorder_traversal(2 * index + 2, result)
+        return result
+
+    def postorder_traversal(self, index=0, result=None):
+        if result is None:
+            result = []
+        if index < len(self.nodes):
+            self.postorder_traversal(2 * index + 1, result)
+            self.postorder_traversal(2 * index + 2, result)
+            result.append(self.nodes[index])
         return result
 
+class AVLNode(Node):
+    def __init__(self, data):
+        super().__init__(data)
+        self.height = 1
+
+class AVLTree(BinaryTree):
+    """Self-balancing binary search tree: every operation is O(log n)"""
+
+    node_class = AVLNode
+
+    def __init__(self):
+        super().__init__()
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def __contains__(self, data):
+        return self.search(data)
+
+    @staticmethod
+    def _height(node):
+        return node.height if node else 0
+
+    def _update(self, node):
+        node.height = 1 + max(self._height(node.left), self._height(node.right))
+
+    def _rotate_right(self, node):
+        pivot = node.left
+        node.left = pivot.right
+        pivot.right = node
+        self._update(node)
+        self._update(pivot)
+        return pivot
+
+    def _rotate_left(self, node):
+        pivot = node.right
+        node.right = pivot.left
+        pivot.left = node
+        self._update(node)
+        self._update(pivot)
+        return pivot
+
+    def _rebalance(self, node):
+        self._update(node)
+        balance = self._height(node.left) - self._height(node.right)
+        if balance > 1:
+            if self._height(node.left.left) < self._height(node.left.right):
+                node.left = self._rotate_left(node.left)
+            return self._rotate_right(node)
+        if balance < -1:
+            if self._height(node.right.right) < self._height(node.right.left):
+                node.right = self._rotate_right(node.right)
+            return self._rotate_left(node)
+        return node
+
+    @classmethod
+    def from_sorted(cls, values):
+        """Height-balanced tree from strictly increasing values (list, NumPy array or iterator) in O(n)"""
+        if np is not None and isinstance(values, np.ndarray):
+            values = values.tolist()
+        elif not isinstance(values, (list, tuple, range)):
+            values = list(values)
+        for i in range(1, len(values)):
+            if values[i - 1] >= values[i]:
+                raise ValueError("from_sorted requires values in strictly increasing order")
+
+        tree = cls()
+        tree.root = tree._build(values, 0, len(values))
+        tree.size = len(values)
+        return tree
+
+    @classmethod
+    def from_iterable(cls, values):
+        """Sort and deduplicate any iterable (or NumPy array), then build with from_sorted: O(n log n)"""
+        if np is not None and isinstance(values, np.ndarray):
+            return cls.from_sorted(np.unique(values))
+        return cls.from_sorted(sorted(set(values)))
+
+    def _build(self, values, start, stop):
+        if start >= stop:
+            return None
+        mid = (start + stop) // 2
+        node = self.node_class(values[mid])
+        node.left = self._build(values, start, mid)
+        node.right = self._build(values, mid + 1, stop)
+        self._update(node)
+        return node
+
+    def insert(self, data):
+        self.invalidate_indexes()
+        self.root = self._insert(self.root, data)
+
+    def _insert(self, node, data):
+        if not node:
+            self.size += 1
+            return self.node_class(data)
+        if data < node.data:
+            node.left = self._insert(node.left, data)
+        elif data > node.data:
+            node.right = self._insert(node.right, data)
+        else:
+            return node
+        return self._rebalance(node)
+
+    def delete(self, data):
+        self.invalidate_indexes()
+        size = self.size
+        self.root = self._delete(self.root, data)
+        return self.size < size
+
+    def _delete(self, node, data):
+        if not node:
+            return None
+        if data < node.data:
+            node.left = self._delete(node.left, data)
+        elif data > node.data:
+            node.right = self._delete(node.right, data)
+        else:
+            if not node.left or not node.right:
+                self.size -= 1
+                return node.left or node.right
+            successor = node.right
+            while successor.left:
+                successor = successor.left
+            node.data = successor.data
+            node.right = self._delete(node.right, successor.data)
+        return self._rebalance(node)
+
+    def search(self, data):
+        node = self.root
+        while node:
+            if data < node.data:
+                node = node.left
+            elif data > node.data:
+                node = node.right
+            else:
+                return True
+        return False
+
+    def min(self):
+        node = self.root
+        if not node:
+            raise ValueError("min() of empty tree")
+        while node.left:
+            node = node.left
+        return node.data
+
+    def max(self):
+        node = self.root
+        if not node:
+            raise ValueError("max() of empty tree")
+        while node.right:
+            node = node.right
+        return node.data
+
+    def floor(self, data):
+        """Largest value <= data, or None"""
+        node, result = self.root, None
+        while node:
+            if data < node.data:
+                node = node.left
+            elif data > node.data:
+                result = node.data
+                node = node.right
+            else:
+                return node.data
+        return result
+
+    def ceiling(self, data):
+        """Smallest value >= data, or None"""
+        node, result = self.root, None
+        while node:
+            if data > node.data:
+                node = node.right
+            elif data < node.data:
+                result = node.data
+                node = node.left
+            else:
+                return node.data
+        return result
+
+    def successor(self, data):
+        """Smallest value strictly greater than data, or None"""
+        node, result = self.root, None
+        while node:
+            if data < node.data:
+                result = node.data
+                node = node.left
+            else:
+                node = node.right
+        return result
+
+    def predecessor(self, data):
+        """Largest value strictly less than data, or None"""
+        node, result = self.root, None
+        while node:
+            if data > node.data:
+                result = node.data
+                node = node.right
+            else:
+                node = node.left
+        return result
+
+    def iter_range(self, low=None, high=None):
+        """Lazily yield values in low <= value <= high, in sorted order"""
+        stack = []
+        node = self.root
+        while stack or node:
+            while node:
+                if low is not None and node.data < low:
+                    node = node.right
+                else:
+                    stack.append(node)
+                    node = node.left
+            if not stack:
+                return
+            node = stack.pop()
+            if high is not None and node.data > high:
+                return
+            yield node.data
+            node = node.right
+
+def benchmark_level_order_insert(sizes=(10**3, 10**4, 10**5, 10**6), linked_limit=10**4):
+    """BinaryTree (BFS insert) vs CompleteBinaryTree (append)"""
+    print(f"\n{'Nodes':>10} {'BinaryTree':>14} {'CompleteBinaryTree':>20}")
+    for size in sizes:
+        complete = CompleteBinaryTree()
+        start_time = time.perf_counter()
+        for value in range(size):
+            complete.insert(value)
+        complete_time = time.perf_counter() - start_time
+
+        linked_time = "skipped"
+        if size <= linked_limit:
+            tree = BinaryTree()
+            start_time = time.perf_counter()
+            for value in range(size):
+                tree.insert(value)
+            linked_time = f"{time.perf_counter() - start_time:.4f}s"
+        print(f"{size:>10} {linked_time:>14} {complete_time:>19.4f}s")
+    print(f"\nBinaryTree is skipped above {linked_limit} nodes: O(n) per insert makes bulk builds O(n²).")
+
+class OrderStatisticNode(AVLNode):
+    def __init__(self, data):
+        super().__init__(data)
+        self.size = 1
+
+class OrderStatisticTree(AVLTree):
+    """AVLTree whose nodes also track subtree size, for O(log n) rank queries"""
+
+    node_class = OrderStatisticNode
+
+    @staticmethod
+    def _size(node):
+        return node.size if node else 0
+
+    def _update(self, node):
+        super()._update(node)
+        node.size = 1 + self._size(node.left) + self._size(node.right)
+
+    def kth(self, k):
+        """k-th smallest value, 0-based like list indexing (negative k counts from the end)"""
+        if k < 0:
+            k += self.size
+        if not 0 <= k < self.size:
+            raise IndexError("kth index out of range")
+        node = self.root
+        while node:
+            left_size = self._size(node.left)
+            if k < left_size:
+                node = node.left
+            elif k == left_size:
+                return node.data
+            else:
+                k -= left_size + 1
+                node = node.right
+
+    def _count_below(self, data, inclusive):
+        count, node = 0, self.root
+        while node:
+            if data < node.data or (data == node.data and not inclusive):
+                node = node.left
+            else:
+                count += self._size(node.left) + 1
+                node = node.right
+        return count
+
+    def rank(self, data):
+        """Number of values strictly less than data"""
+        return self._count_below(data, inclusive=False)
+
+    def count_range(self, low, high):
+        """Number of values with low <= value <= high"""
+        if high < low:
+            return 0
+        return self._count_below(high, inclusive=True) - self._count_below(low, inclusive=False)
+
+class SplayTree(BinaryTree):
+    """Self-adjusting search tree: every access moves the key to the root, amortized O(log n)"""
+
+    def __init__(self):
+        super().__init__()
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def __contains__(self, data):
+        return self.search(data)
+
+    def _splay(self, data):
+        # Top-down splay: split the access path into left/right trees, then reassemble at the target
+        node = self.root
+        if not node or node.data == data:
+            return
+        self.invalidate_indexes()
+        header = Node(None)
+        left_max = right_min = header
+        while True:
+            if data < node.data:
+                if not node.left:
+                    break
+                if data < node.left.data:
+                    child = node.left
+                    node.left = child.right
+                    child.right = node
+                    node = child
+                    if not node.left:
+                        break
+                right_min.left = node
+                right_min = node
+                node = node.left
+            elif data > node.data:
+                if not node.right:
+                    break
+                if data > node.right.data:
+                    child = node.right
+                    node.right = child.left
+                    child.left = node
+                    node = child
+                    if not node.right:
+                        break
+                left_max.right = node
+                left_max = node
+                node = node.right
+            else:
+                break
+        left_max.right = node.left
+        right_min.left = node.right
+        node.left = header.right
+        node.right = header.left
+        self.root = node
+
+    def insert(self, data):
+        if not self.root:
+            self.invalidate_indexes()
+            self.root = Node(data)
+            self.size += 1
+            return
+        self._splay(data)
+        if data == self.root.data:
+            return
+        node = Node(data)
+        if data < self.root.data:
+            node.left, node.right = self.root.left, self.root
+            self.root.left = None
+        else:
+            node.left, node.right = self.root, self.root.right
+            self.root.right = None
+        self.root = node
+        self.size += 1
+
+    def search(self, data):
+        self._splay(data)
+        return self.root is not None and self.root.data == data
+
+    def delete(self, data):
+        if not self.search(data):
+            return False
+        self.invalidate_indexes()
+        right = self.root.right
+        if self.root.left:
+            # Splaying the left subtree for data brings its maximum up with no right child
+            self.root = self.root.left
+            self._splay(data)
+            self.root.right = right
+        else:
+            self.root = right
+        self.size -= 1
+        return True
+
+class PersistentNode:
+    __slots__ = ("data", "left", "right", "height")
+
+    def __init__(self, data, left=None, right=None):
+        self.data = data
+        self.left = left
+        self.right = right
+        self.height = 1 + max(left.height if left else 0, right.height if right else 0)
+
+class PersistentTree:
+    """Immutable AVL tree: insert/delete return a new version that shares all untouched nodes.
+
+    Nodes are never modified after creation, so any version can be read from other
+    threads without locks while a writer keeps producing new versions.
+    """
+
+    def __init__(self, root=None, size=0):
+        self.root = root
+        self.size = size
+
+    def __len__(self):
+        return self.size
+
+    def __contains__(self, data):
+        return self.search(data)
+
+    @staticmethod
+    def _height(node):
+        return node.height if node else 0
+
+    def _balance(self, data, left, right):
+        # Rotations build new nodes instead of relinking old ones
+        if self._height(left) > self._height(right) + 1:
+            if self._height(left.left) >= self._height(left.right):
+                return PersistentNode(left.data, left.left, PersistentNode(data, left.right, right))
+            pivot = left.right
+            return PersistentNode(pivot.data, PersistentNode(left.data, left.left, pivot.left),
+                                  PersistentNode(data, pivot.right, right))
+        if self._height(right) > self._height(left) + 1:
+            if self._height(right.right) >= self._height(right.left):
+                return PersistentNode(right.data, PersistentNode(data, left, right.left), right.right)
+            pivot = right.left
+            return PersistentNode(pivot.data, PersistentNode(data, left, pivot.left),
+                                  PersistentNode(right.data, pivot.right, right.right))
+        return PersistentNode(data, left, right)
+
+    def insert(self, data):
+        """New version containing data; returns self unchanged if it is already present"""
+        root = self._insert(self.root, data)
+        return self if root is self.root else PersistentTree(root, self.size + 1)
+
+    def _insert(self, node, data):
+        if not node:
+            return PersistentNode(data)
+        if data < node.data:
+            left = self._insert(node.left, data)
+            return node if left is node.left else self._balance(node.data, left, node.right)
+        if data > node.data:
+            right = self._insert(node.right, data)
+            return node if right is node.right else self._balance(node.data, node.left, right)
+        return node
+
+    def delete(self, data):
+        """New version without data; returns self unchanged if it is absent"""
+        root, removed = self._delete(self.root, data)
+        return PersistentTree(root, self.size - 1) if removed else self
+
+    def _delete(self, node, data):
+        if not node:
+            return None, False
+        if data < node.data:
+            left, removed = self._delete(node.left, data)
+            return (self._balance(node.data, left, node.right), True) if removed else (node, False)
+        if data > node.data:
+            right, removed = self._delete(node.right, data)
+            return (self._balance(node.data, node.left, right), True) if removed else (node, False)
+        if not node.left or not node.right:
+            return node.left or node.right, True
+        successor = node.right
+        while successor.left:
+            successor = successor.left
+        right, _ = self._delete(node.right, successor.data)
+        return self._balance(successor.data, node.left, right), True
+
+    def search(self, data):
+        node = self.root
+        while node:
+            if data < node.data:
+                node = node.left
+            elif data > node.data:
+                node = node.right
+            else:
+                return True
+        return False
+
+    def iter_inorder(self):
+        stack, node = [], self.root
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.data
+            node = node.right
+
+    def inorder_traversal(self):
+        return list(self.iter_inorder())
+
+class BPlusLeaf:
+    def __init__(self, keys=None, values=None):
+        self.keys = keys if keys is not None else []
+        self.values = values if values is not None else []
+        self.next = None
+
+class BPlusInternal:
+    def __init__(self, keys=None, children=None):
+        self.keys = keys if keys is not None else []
+        self.children = children if children is not None else []
+
+class BPlusTree:
+    """Ordered key -> value index with fan-out `order` and linked leaves"""
+
+    PAGE_MAGIC = b"BPT1"
+    PAGE_HEADER = struct.Struct("<4sIIIIq")  # magic, order, page size, root, first leaf, size
+    NODE_HEADER = struct.Struct("<BxxxIq")   # kind, key count, next leaf page
+    LEAF, INTERNAL = 1, 2
+
+    def __init__(self, order=64):
+        if order < 3:
+            raise ValueError("order must be at least 3")
+        self.order = order
+        self.root = BPlusLeaf()
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def __contains__(self, key):
+        return self.search(key)
+
+    def _find_leaf(self, key):
+        node = self.root
+        while isinstance(node, BPlusInternal):
+            node = node.children[bisect.bisect_right(node.keys, key)]
+        return node
+
+    def get(self, key, default=None):
+        leaf = self._find_leaf(key)
+        i = bisect.bisect_left(leaf.keys, key)
+        if i < len(leaf.keys) and leaf.keys[i] == key:
+            return leaf.values[i]
+        return default
+
+    def search(self, key):
+        leaf = self._find_leaf(key)
+        i = bisect.bisect_left(leaf.keys, key)
+        return i < len(leaf.keys) and leaf.keys[i] == key
+
+    def insert(self, key, value=None):
+        split = self._insert(self.root, key, value)
+        if split:
+            separator, sibling = split
+            self.root = BPlusInternal([separator], [self.root, sibling])
+
+    def _insert(self, node, key, value):
+        if isinstance(node, BPlusLeaf):
+            i = bisect.bisect_left(node.keys, key)
+            if i < len(node.keys) and node.keys[i] == key:
+                node.values[i] = value
+                return None
+            node.keys.insert(i, key)
+            node.values.insert(i, value)
+            self.size += 1
+            if len(node.keys) <= self.order:
+                return None
+            mid = len(node.keys) // 2
+            sibling = BPlusLeaf(node.keys[mid:], node.values[mid:])
+            del node.keys[mid:], node.values[mid:]
+            sibling.next, node.next = node.next, sibling
+            return sibling.keys[0], sibling
+
+        i = bisect.bisect_right(node.keys, key)
+        split = self._insert(node.children[i], key, value)
+        if not split:
+            return None
+        separator, child = split
+        node.keys.insert(i, separator)
+        node.children.insert(i + 1, child)
+        if len(node.children) <= self.order:
+            return None
+        mid = len(node.keys) // 2
+        separator = node.keys[mid]
+        sibling = BPlusInternal(node.keys[mid + 1:], node.children[mid + 1:])
+        del node.keys[mid:], node.children[mid + 1:]
+        return separator, sibling
+
+    def iter_range(self, low=None, high=None):
+        """Lazily yield (key, value) pairs with low <= key <= high by walking the leaf chain"""
+        if low is None:
+            node = self.root
+            while isinstance(node, BPlusInternal):
+                node = node.children[0]
+            leaf, i = node, 0
+        else:
+            leaf = self._find_leaf(low)
+            i = bisect.bisect_left(leaf.keys, low)
+        while leaf:
+            keys, values = leaf.keys, leaf.values
+            while i < len(keys):
+                if high is not None and keys[i] > high:
+                    return
+                yield keys[i], values[i]
+                i += 1
+            leaf, i = leaf.next, 0
+
+    def items(self):
+        return self.iter_range()
+
+    @staticmethod
+    def _chunks(items, max_size):
+        # Split evenly so no node ends up nearly empty
+        count = -(-len(items) // max_size)
+        step, extra = divmod(len(items), count)
+        start = 0
+        for i in range(count):
+            end = start + step + (1 if i < extra else 0)
+            yield items[start:end]
+            start = end
+
+    @classmethod
+    def bulk_load(cls, items, order=64):
+        """Build bottom-up from (key, value) pairs sorted by strictly increasing key: O(n)"""
+        tree = cls(order)
+        keys, values = [], []
+        for key, value in items:
+            if keys and key <= keys[-1]:
+                raise ValueError("bulk_load requires keys in strictly increasing order")
+            keys.append(key)
+            values.append(value)
+        if not keys:
+            return tree
+
+        level, previous = [], None
+        for chunk in cls._chunks(range(len(keys)), order):
+            leaf = BPlusLeaf(keys[chunk.start:chunk.stop], values[chunk.start:chunk.stop])
+            if previous:
+                previous.next = leaf
+            previous = leaf
+            level.append((leaf.keys[0], leaf))
+
+        while len(level) > 1:
+            level = [
+                (group[0][0], BPlusInternal([low for low, _ in group[1:]], [node for _, node in group]))
+                for group in cls._chunks(level, order)
+            ]
+        tree.root = level[0][1]
+        tree.size = len(keys)
+        return tree
+
+    def page_size(self):
+        return self.NODE_HEADER.size + 16 * self.order
+
+    def save(self, path):
+        """Write a page file of 64-bit integer keys/values that MappedBPlusTree can open"""
+        page_size = self.page_size()
+        pages, leaves = [], []
+        queue = deque([self.root])
+        while queue:
+            node = queue.popleft()
+            pages.append(node)
+            if isinstance(node, BPlusInternal):
+                queue.extend(node.children)
+            else:
+                leaves.append(node)
+        page_of = {id(node): number for number, node in enumerate(pages, 1)}
+
+        # Pages go to a temporary file that replaces `path` only once every page has packed,
+        # so a key or value that does not fit leaves any existing file untouched
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                header = self.PAGE_HEADER.pack(self.PAGE_MAGIC, self.order, page_size, 1, page_of[id(leaves[0])], self.size)
+                f.write(header.ljust(page_size, b"\0"))
+                for node in pages:
+                    if isinstance(node, BPlusLeaf):
+                        next_page = page_of[id(node.next)] if node.next else 0
+                        page = self.NODE_HEADER.pack(self.LEAF, len(node.keys), next_page)
+                        page += struct.pack(f"<{self.order}q", *node.keys, *[0] * (self.order - len(node.keys)))
+                        page += struct.pack(f"<{len(node.values)}q", *node.values)
+                    else:
+                        page = self.NODE_HEADER.pack(self.INTERNAL, len(node.keys), 0)
+                        page += struct.pack(f"<{self.order}q", *node.keys, *[0] * (self.order - len(node.keys)))
+                        page += struct.pack(f"<{len(node.children)}q", *(page_of[id(child)] for child in node.children))
+                    f.write(page.ljust(page_size, b"\0"))
+            os.replace(temp_path, path)
+        except struct.error as e:
+            os.unlink(temp_path)
+            raise TypeError(f"page files store 64-bit integer keys and values: {e}") from None
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+class MappedBPlusTree:
+    """Read-only B+-tree opened from a BPlusTree.save() page file via mmap"""
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.order, self._page_size, self._root, self._first_leaf, self.size = \
+            BPlusTree.PAGE_HEADER.unpack_from(self._mmap, 0)
+        if magic != BPlusTree.PAGE_MAGIC:
+            self._mmap.close()
+            raise ValueError(f"{path} is not a B+-tree page file")
+        self._words = memoryview(self._mmap).cast("q")
+
+    def __len__(self):
+        return self.size
+
+    def __contains__(self, key):
+        return self.search(key)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self._words.release()
+        self._mmap.close()
+
+    def _page(self, number):
+        # `order` key slots, then values (leaf) or child page numbers (internal), as zero-copy int64 views
+        kind, count, next_page = BPlusTree.NODE_HEADER.unpack_from(self._mmap, number * self._page_size)
+        start = (number * self._page_size + BPlusTree.NODE_HEADER.size) // 8
+        keys = self._words[start:start + count]
+        width = count if kind == BPlusTree.LEAF else count + 1
+        start += self.order
+        return kind, keys, self._words[start:start + width], next_page
+
+    def _find_leaf(self, key):
+        kind, keys, payload, next_page = self._page(self._root)
+        while kind == BPlusTree.INTERNAL:
+            kind, keys, payload, next_page = self._page(payload[bisect.bisect_right(keys, key)])
+        return keys, payload, next_page
+
+    def get(self, key, default=None):
+        keys, values, _ = self._find_leaf(key)
+        i = bisect.bisect_left(keys, key)
+        if i < len(keys) and keys[i] == key:
+            return values[i]
+        return default
+
+    def search(self, key):
+        keys, _, _ = self._find_leaf(key)
+        i = bisect.bisect_left(keys, key)
+        return i < len(keys) and keys[i] == key
+
+    def iter_range(self, low=None, high=None):
+        # Each leaf is copied out as lists: a zero-copy view held by a suspended generator
+        # would make close() fail with BufferError
+        if low is None:
+            _, keys, values, next_page = self._page(self._first_leaf)
+            i = 0
+        else:
+            keys, values, next_page = self._find_leaf(low)
+            i = bisect.bisect_left(keys, low)
+        keys, values = keys.tolist(), values.tolist()
+        while True:
+            while i < len(keys):
+                if high is not None and keys[i] > high:
+                    return
+                yield keys[i], values[i]
+                i += 1
+            if not next_page:
+                return
+            _, keys, values, next_page = self._page(next_page)
+            keys, values = keys.tolist(), values.tolist()
+            i = 0
+
+def _check_range(start, stop, length):
+    if not 0 <= start <= stop <= length:
+        raise IndexError(f"range [{start}, {stop}) out of bounds for length {length}")
+
+def _numeric_array(values):
+    values = np.asarray(values)
+    dtype = np.int64 if np.issubdtype(values.dtype, np.integer) else np.float64
+    return values.astype(dtype, copy=False)
+
+def _widened(array, delta):
+    """array as float64 if adding delta to it in place would truncate, else array itself"""
+    if array.dtype.kind == "i" and not isinstance(delta, (int, np.integer)):
+        return array.astype(np.float64)
+    return array
+
+class SegmentTree:
+    """Range sum/min queries and range add updates in O(log n), over half-open [start, stop)"""
+
+    def __init__(self, values, use_numpy=False):
+        if use_numpy and np is None:
+            raise ImportError("use_numpy=True requires NumPy")
+        values = _numeric_array(values) if use_numpy else list(values)
+        self.use_numpy = use_numpy
+        self.n = len(values)
+        self._size = 1
+        while self._size < self.n:
+            self._size *= 2
+
+        # Heap layout: root at 1, children of i at 2i/2i+1, leaves at [size, size + n).
+        # Padding leaves are never fully covered by a query, so their values never matter.
+        size = self._size
+        if use_numpy:
+            self.sums = np.zeros(2 * size, dtype=values.dtype)
+            self.sums[size:size + self.n] = values
+            self.mins = self.sums.copy()
+            level = size
+            while level > 1:
+                half = level // 2
+                left, right = slice(level, 2 * level, 2), slice(level + 1, 2 * level, 2)
+                self.sums[half:level] = self.sums[left] + self.sums[right]
+                self.mins[half:level] = np.minimum(self.mins[left], self.mins[right])
+                level = half
+            self.lazy = np.zeros(2 * size, dtype=values.dtype)
+        else:
+            self.sums = [0] * (2 * size)
+            self.sums[size:size + self.n] = values
+            self.mins = self.sums[:]
+            for i in range(size - 1, 0, -1):
+                self.sums[i] = self.sums[2 * i] + self.sums[2 * i + 1]
+                self.mins[i] = min(self.mins[2 * i], self.mins[2 * i + 1])
+            self.lazy = [0] * (2 * size)
+
+    def __len__(self):
+        return self.n
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self.n
+        return self.range_sum(index, index + 1)
+
+    def _apply(self, node, length, delta):
+        self.sums[node] += delta * length
+        self.mins[node] += delta
+        if node < self._size:
+            self.lazy[node] += delta
+
+    def _push(self, node, length):
+        delta = self.lazy[node]
+        if delta:
+            self._apply(2 * node, length // 2, delta)
+            self._apply(2 * node + 1, length // 2, delta)
+            self.lazy[node] = 0
+
+    def _add(self, node, low, high, start, stop, delta):
+        if stop <= low or high <= start:
+            return
+        if start <= low and high <= stop:
+            self._apply(node, high - low, delta)
+            return
+        self._push(node, high - low)
+        mid = (low + high) // 2
+        self._add(2 * node, low, mid, start, stop, delta)
+        self._add(2 * node + 1, mid, high, start, stop, delta)
+        self.sums[node] = self.sums[2 * node] + self.sums[2 * node + 1]
+        self.mins[node] = min(self.mins[2 * node], self.mins[2 * node + 1])
+
+    def _sum(self, node, low, high, start, stop):
+        if stop <= low or high <= start:
+            return 0
+        if start <= low and high <= stop:
+            return self.sums[node]
+        self._push(node, high - low)
+        mid = (low + high) // 2
+        return self._sum(2 * node, low, mid, start, stop) + self._sum(2 * node + 1, mid, high, start, stop)
+
+    def _min(self, node, low, high, start, stop):
+        if start <= low and high <= stop:
+            return self.mins[node]
+        self._push(node, high - low)
+        mid = (low + high) // 2
+        if stop <= mid:
+            return self._min(2 * node, low, mid, start, stop)
+        if start >= mid:
+            return self._min(2 * node + 1, mid, high, start, stop)
+        return min(self._min(2 * node, low, mid, start, stop), self._min(2 * node + 1, mid, high, start, stop))
+
+    def range_sum(self, start, stop):
+        _check_range(start, stop, self.n)
+        return self._sum(1, 0, self._size, start, stop)
+
+    def range_min(self, start, stop):
+        _check_range(start, stop, self.n)
+        if start == stop:
+            raise ValueError("range_min() of empty range")
+        return self._min(1, 0, self._size, start, stop)
+
+    def range_add(self, start, stop, delta):
+        _check_range(start, stop, self.n)
+        if self.use_numpy:
+            # int64 arrays would silently truncate a float delta, so they become float64 first
+            self.sums, self.mins, self.lazy = (_widened(array, delta) for array in (self.sums, self.mins, self.lazy))
+        self._add(1, 0, self._size, start, stop, delta)
+
+    def update(self, index, value):
+        self.range_add(index, index + 1, value - self[index])
+
+class FenwickTree:
+    """Binary indexed tree: prefix sums and point updates in O(log n)"""
+
+    def __init__(self, values, use_numpy=False):
+        if use_numpy and np is None:
+            raise ImportError("use_numpy=True requires NumPy")
+        self.use_numpy = use_numpy
+        if use_numpy:
+            values = _numeric_array(values)
+            self.n = len(values)
+            # tree[i] covers (i - lowbit(i), i]: a difference of two prefix sums
+            prefix = np.zeros(self.n + 1, dtype=values.dtype)
+            np.cumsum(values, out=prefix[1:])
+            index = np.arange(1, self.n + 1)
+            self.tree = np.zeros(self.n + 1, dtype=values.dtype)
+            self.tree[1:] = prefix[index] - prefix[index - (index & -index)]
+        else:
+            self.tree = [0] + list(values)
+            self.n = len(self.tree) - 1
+            for i in range(1, self.n + 1):
+                parent = i + (i & -i)
+                if parent <= self.n:
+                    self.tree[parent] += self.tree[i]
+
+    def __len__(self):
+        return self.n
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self.n
+        return self.range_sum(index, index + 1)
+
+    def add(self, index, delta):
+        if not 0 <= index < self.n:
+            raise IndexError("FenwickTree index out of range")
+        if self.use_numpy:
+            self.tree = _widened(self.tree, delta)
+        i = index + 1
+        while i <= self.n:
+            self.tree[i] += delta
+            i += i & -i
+
+    def update(self, index, value):
+        self.add(index, value - self[index])
+
+    def prefix_sum(self, stop):
+        """Sum of the first `stop` values"""
+        _check_range(0, stop, self.n)
+        total = 0
+        while stop > 0:
+            total += self.tree[stop]
+            stop &= stop - 1
+        return total
+
+    def range_sum(self, start, stop):
+        _check_range(start, stop, self.n)
+        return self.prefix_sum(stop) - self.prefix_sum(start)
+
+class RadixNode:
+    __slots__ = ("rest", "children", "value", "terminal", "count")
+
+    def __init__(self, rest=(), value=None, terminal=False):
+        self.rest = rest          # edge segments after the first, which is this node's key in the parent
+        self.children = None      # first segment -> child node, or the bare value of a one-segment leaf
+        self.value = value
+        self.terminal = terminal
+        self.count = int(terminal)  # entries stored in this subtree
+
+_NO_CHILD = object()
+
+class PathTrie:
+    """Compressed radix trie keyed by path segments: O(k) for a path of k segments
+
+    A path whose last segment hangs off a node with nothing below it is stored as its
+    bare value in the parent's children dict, so leaves cost one dict slot, not a node.
+    """
+
+    def __init__(self, separator="/"):
+        self.separator = separator
+        self.root = RadixNode()
+
+    def __len__(self):
+        return self.root.count
+
+    def __contains__(self, path):
+        return self._find(path) is not _NO_CHILD
+
+    def _split(self, path):
+        # Directory segments are interned so every path that repeats them shares one string.
+        # The last segment is usually unique, and interning it would only grow the intern table.
+        segments = [segment for segment in path.split(self.separator) if segment]
+        return tuple([sys.intern(segment) for segment in segments[:-1]] + segments[-1:])
+
+    def _join(self, segments):
+        return self.separator + self.separator.join(segments)
+
+    def _leaf(self, rest, value):
+        # A RadixNode value would be mistaken for a child, so it always gets a node of its own
+        if rest or type(value) is RadixNode:
+            return RadixNode(rest, value, terminal=True)
+        return value
+
+    def insert(self, path, value=None):
+        segments = self._split(path)
+        node, i = self.root, 0
+        visited = [node]
+        while i < len(segments):
+            if node.children is None:
+                node.children = {}
+            key = segments[i]
+            child = node.children.get(key, _NO_CHILD)
+            if child is _NO_CHILD:
+                node.children[key] = self._leaf(segments[i + 1:], value)
+                for ancestor in visited:
+                    ancestor.count += 1
+                return
+            if type(child) is not RadixNode:
+                if i + 1 == len(segments):
+                    node.children[key] = self._leaf((), value)
+                    return
+                # The path continues below a bare leaf, so the leaf becomes a node
+                child = node.children[key] = RadixNode((), child, terminal=True)
+            rest, common = child.rest, 0
+            while common < len(rest) and i + 1 + common < len(segments) \
+                    and rest[common] == segments[i + 1 + common]:
+                common += 1
+            if common < len(rest):
+                # Split the edge so the shared part becomes its own node
+                middle = RadixNode(rest[:common])
+                middle.count = child.count
+                middle.children = {rest[common]: child}
+                child.rest = rest[common + 1:]
+                node.children[key] = middle
+                child = middle
+            visited.append(child)
+            node = child
+            i += 1 + common
+
+        if not node.terminal:
+            node.terminal = True
+            for ancestor in visited:
+                ancestor.count += 1
+        node.value = value
+
+    def _locate(self, segments):
+        """Node (or bare leaf value) whose subtree holds every path starting with segments, plus its full path"""
+        node, full = self.root, ()
+        while len(full) < len(segments):
+            key = segments[len(full)]
+            child = node.children.get(key, _NO_CHILD) if node.children else _NO_CHILD
+            if child is _NO_CHILD:
+                return _NO_CHILD, None
+            if type(child) is not RadixNode:
+                if len(full) + 1 < len(segments):
+                    return _NO_CHILD, None
+                return child, full + (key,)
+            rest, start = child.rest, len(full) + 1
+            if rest[:len(segments) - start] != segments[start:start + len(rest)]:
+                return _NO_CHILD, None
+            node, full = child, full + (key,) + rest
+        return node, full
+
+    def _find(self, path):
+        """Value stored at path, or _NO_CHILD"""
+        segments = self._split(path)
+        node, full = self._locate(segments)
+        if node is _NO_CHILD or len(full) != len(segments):
+            return _NO_CHILD
+        if type(node) is not RadixNode:
+            return node
+        return node.value if node.terminal else _NO_CHILD
+
+    def get(self, path, default=None):
+        value = self._find(path)
+        return default if value is _NO_CHILD else value
+
+    def search(self, path):
+        return path in self
+
+    def count(self, prefix=""):
+        """Number of entries at or under prefix, in O(k)"""
+        node, _ = self._locate(self._split(prefix))
+        if node is _NO_CHILD:
+            return 0
+        return node.count if type(node) is RadixNode else 1
+
+    def iter_prefix(self, prefix=""):
+        """Lazily yield (path, value) for every entry at or under prefix, in sorted order"""
+        node, segments = self._locate(self._split(prefix))
+        if node is _NO_CHILD:
+            return
+        stack = [(node, segments)]
+        while stack:
+            node, segments = stack.pop()
+            if type(node) is not RadixNode:
+                yield self._join(segments), node
+                continue
+            if node.terminal:
+                yield self._join(segments), node.value
+            for key in sorted(node.children or (), reverse=True):
+                child = node.children[key]
+                if type(child) is RadixNode:
+                    stack.append((child, segments + (key,) + child.rest))
+                else:
+                    stack.append((child, segments + (key,)))
+
+def _level_order_tree(values):
+    # Link nodes directly in level order: O(n), unlike repeated BinaryTree.insert
+    tree = BinaryTree()
+    nodes = [Node(value) for value in values]
+    for i, node in enumerate(nodes):
+        if 2 * i + 1 < len(nodes):
+            node.left = nodes[2 * i + 1]
+        if 2 * i + 2 < len(nodes):
+            node.right = nodes[2 * i + 2]
+    tree.root = nodes[0] if nodes else None
+    return tree
+
+def benchmark_search(sizes=(10**3, 10**4, 10**5), queries=1000, bfs_queries=50):
+    """BinaryTree BFS search vs AVLTree vs bisect on a sorted list"""
+    import random
+
+    print(f"\n{'Nodes':>10} {'BFS search':>14} {'AVLTree':>12} {'bisect':>12}   (µs per lookup)")
+    for size in sizes:
+        values = random.sample(range(size * 10), size)
+        targets = [random.choice(values) for _ in range(queries)]
+
+        tree = _level_order_tree(values)
+        start_time = time.perf_counter()
+        for target in targets[:bfs_queries]:
+            tree.search(target)
+        bfs_time = (time.perf_counter() - start_time) / bfs_queries
+
+        avl = AVLTree()
+        for value in values:
+            avl.insert(value)
+        start_time = time.perf_counter()
+        for target in targets:
+            avl.search(target)
+        avl_time = (time.perf_counter() - start_time) / queries
+
+        sorted_values = sorted(values)
+        start_time = time.perf_counter()
+        for target in targets:
+            i = bisect.bisect_left(sorted_values, target)
+            i < size and sorted_values[i] == target
+        bisect_time = (time.perf_counter() - start_time) / queries
+
+        print(f"{size:>10} {bfs_time * 1e6:>14.2f} {avl_time * 1e6:>12.2f} {bisect_time * 1e6:>12.2f}")
+    print("\nAVLTree and bisect both stay O(log n); only AVLTree also supports O(log n) insert/delete.")
+
+def benchmark_ordered_index(sizes=(10**4, 10**5, 10**6), queries=10000, scan_length=1000, avl_limit=10**5):
+    """Point lookups and range scans: BPlusTree vs AVLTree vs dict"""
+    import random
+
+    print(f"\n{'Keys':>10} {'':>8} {'BPlusTree':>12} {'AVLTree':>12} {'dict':>12}   (µs per operation)")
+    for size in sizes:
+        keys = list(range(0, size * 2, 2))
+        bplus = BPlusTree.bulk_load((key, key) for key in keys)
+        lookup_keys = [random.choice(keys) for _ in range(queries)]
+        scan_starts = [random.choice(keys) for _ in range(100)]
+
+        avl = None
+        if size <= avl_limit:
+            avl = AVLTree()
+            for key in random.sample(keys, size):
+                avl.insert(key)
+        table = {key: key for key in keys}
+
+        def timed(action, args):
+            start_time = time.perf_counter()
+            for arg in args:
+                action(arg)
+            return f"{(time.perf_counter() - start_time) / len(args) * 1e6:.2f}"
+
+        def bplus_scan(low):
+            for _ in bplus.iter_range(low, low + 2 * scan_length):
+                pass
+
+        def avl_scan(low):
+            for _ in avl.iter_range(low, low + 2 * scan_length):
+                pass
+
+        def dict_scan(low):
+            # dict has no order: a range scan must filter every key
+            [key for key in table if low <= key <= low + 2 * scan_length]
+
+        lookups = (timed(bplus.get, lookup_keys),
+                   timed(avl.search, lookup_keys) if avl else "skipped",
+                   timed(table.get, lookup_keys))
+        scans = (timed(bplus_scan, scan_starts),
+                 timed(avl_scan, scan_starts) if avl else "skipped",
+                 timed(dict_scan, scan_starts[:5]))
+        print(f"{size:>10} {'lookup':>8} {lookups[0]:>12} {lookups[1]:>12} {lookups[2]:>12}")
+        print(f"{'':>10} {'scan':>8} {scans[0]:>12} {scans[1]:>12} {scans[2]:>12}")
+    print(f"\nScans read {scan_length} consecutive keys. AVLTree is skipped above {avl_limit} keys (slow Python build).")
+
+def benchmark_range_queries(sizes=(10**4, 10**5, 10**6), queries=1000):
+    """Range sums: slice rescans vs SegmentTree vs FenwickTree"""
+    import random
+
+    print(f"\n{'Values':>10} {'':>7} {'slice sum':>12} {'SegmentTree':>12} {'FenwickTree':>12}   (µs per operation)")
+    for size in sizes:
+        values = [random.randrange(1000) for _ in range(size)]
+        ranges = [sorted(random.sample(range(size + 1), 2)) for _ in range(queries)]
+        updates = [(random.randrange(size), random.randrange(1000)) for _ in range(queries)]
+
+        start_time = time.perf_counter()
+        segment = SegmentTree(values)
+        segment_build = time.perf_counter() - start_time
+        start_time = time.perf_counter()
+        fenwick = FenwickTree(values)
+        fenwick_build = time.perf_counter() - start_time
+
+        def timed(action, args):
+            start_time = time.perf_counter()
+            for arg in args:
+                action(*arg)
+            return (time.perf_counter() - start_time) / len(args) * 1e6
+
+        def slice_update(index, value):
+            values[index] = value
+
+        query_times = (timed(lambda start, stop: sum(values[start:stop]), ranges),
+                       timed(segment.range_sum, ranges), timed(fenwick.range_sum, ranges))
+        update_times = (timed(slice_update, updates), timed(segment.update, updates), timed(fenwick.update, updates))
+        print(f"{size:>10} {'query':>7} {query_times[0]:>12.2f} {query_times[1]:>12.2f} {query_times[2]:>12.2f}")
+        print(f"{'':>10} {'update':>7} {update_times[0]:>12.2f} {update_times[1]:>12.2f} {update_times[2]:>12.2f}")
+        print(f"{'':>10} {'build':>7} {'-':>12} {segment_build * 1e3:>10.1f}ms {fenwick_build * 1e3:>10.1f}ms")
+
+    if np is not None:
+        values = np.random.randint(0, 1000, sizes[-1])
+        start_time = time.perf_counter()
+        SegmentTree(values, use_numpy=True)
+        FenwickTree(values, use_numpy=True)
+        print(f"\nNumPy-backed build of both trees for {sizes[-1]} values: {(time.perf_counter() - start_time) * 1e3:.1f}ms")
+
+def _synthetic_paths(count):
+    return [f"/home/user{i % 1000}/projects/p{i % 37}/file{i}.txt" for i in range(count)]
+
+def benchmark_path_prefix(sizes=(10**4, 10**5, 10**6), queries=20):
+    """Prefix listing: dict of paths with a startswith scan vs PathTrie"""
+    import random
+    import tracemalloc
+
+    print(f"\n{'Paths':>10} {'dict scan':>12} {'trie list':>12} {'trie count':>12} {'dict MB':>9} {'trie MB':>9}")
+    for size in sizes:
+        paths = _synthetic_paths(size)
+        prefixes = [f"/home/user{random.randrange(1000)}" for _ in range(queries)]
+
+        tracemalloc.start()
+        table = {path: None for path in _synthetic_paths(size)}
+        dict_memory = tracemalloc.get_traced_memory()[0] / 2**20
+        tracemalloc.stop()
+        tracemalloc.start()
+        trie = PathTrie()
+        for path in paths:
+            trie.insert(path)
+        trie_memory = tracemalloc.get_traced_memory()[0] / 2**20
+        tracemalloc.stop()
+
+        def timed(action):
+            start_time = time.perf_counter()
+            for prefix in prefixes:
+                action(prefix)
+            return (time.perf_counter() - start_time) / len(prefixes) * 1e3
+
+        dict_time = timed(lambda prefix: [path for path in table if path.startswith(prefix + "/")])
+        list_time = timed(lambda prefix: list(trie.iter_prefix(prefix)))
+        count_time = timed(trie.count)
+        print(f"{size:>10} {dict_time:>10.3f}ms {list_time:>10.3f}ms {count_time:>10.4f}ms {dict_memory:>9.1f} {trie_memory:>9.1f}")
+    print("\nMemory is what tracemalloc saw while building each structure. The trie stores each directory once")
+    print("and each file as one name in its directory's dict, but every directory costs a node and a dict.")
+    print("These paths spread over 37,000 directories: at 10^5 paths that is under 3 files per directory and")
+    print("the dict is smaller; at 10^6 (27 files per directory) the trie is smaller.")
+
+def benchmark_tree_load(sizes=(10**4, 10**5, 10**6), insert_limit=10**4):
+    """Rebuilding a BinaryTree: repeated insert vs eager load vs lazy mmap load"""
+    import os
+    import tempfile
+
+    print(f"\n{'Nodes':>10} {'insert loop':>12} {'load':>10} {'lazy load':>10} {'file MB':>8}")
+    for size in sizes:
+        values = list(range(size))
+        path = os.path.join(tempfile.mkdtemp(), "tree.bin")
+        _level_order_tree(values).save(path)
+
+        insert_time = "skipped"
+        if size <= insert_limit:
+            start_time = time.perf_counter()
+            tree = BinaryTree()
+            for value in values:
+                tree.insert(value)
+            insert_time = f"{(time.perf_counter() - start_time) * 1e3:.1f}ms"
+
+        start_time = time.perf_counter()
+        BinaryTree.load(path, lazy=False)
+        eager_time = time.perf_counter() - start_time
+        start_time = time.perf_counter()
+        tree = BinaryTree.load(path)
+        tree.root.left.right.data
+        lazy_time = time.perf_counter() - start_time
+
+        print(f"{size:>10} {insert_time:>12} {eager_time * 1e3:>8.1f}ms {lazy_time * 1e3:>8.3f}ms {os.path.getsize(path) / 2**20:>8.2f}")
+        del tree
+        os.remove(path)
+        os.rmdir(os.path.dirname(path))
+    print("\nLazy load maps the file and decodes only the nodes that are visited.")
+
+def benchmark_bulk_build(sizes=(10**4, 10**5, 10**6), insert_limit=10**5):
+    """Building an AVLTree: insert loop vs from_sorted vs from_iterable"""
+    import random
+
+    print(f"\n{'Keys':>10} {'insert loop':>12} {'from_sorted':>12} {'from_iterable':>14}")
+    for size in sizes:
+        values = random.sample(range(size * 4), size)
+
+        insert_time = "skipped"
+        if size <= insert_limit:
+            start_time = time.perf_counter()
+            tree = AVLTree()
+            for value in values:
+                tree.insert(value)
+            insert_time = f"{time.perf_counter() - start_time:.3f}s"
+
+        ordered = sorted(values)
+        start_time = time.perf_counter()
+        AVLTree.from_sorted(ordered)
+        sorted_time = time.perf_counter() - start_time
+        start_time = time.perf_counter()
+        AVLTree.from_iterable(iter(values))
+        iterable_time = time.perf_counter() - start_time
+        print(f"{size:>10} {insert_time:>12} {sorted_time:>11.3f}s {iterable_time:>13.3f}s")
+
+def benchmark_node_storage(sizes=(10**4, 10**5, 10**6)):
+    """Memory per node and full-GC time: BinaryTree nodes vs PackedBinaryTree arrays"""
+    import gc
+    import tracemalloc
+
+    print(f"\n{'Nodes':>10} {'Node B/node':>12} {'Packed B/node':>14} {'Node GC':>10} {'Packed GC':>10}")
+    for size in sizes:
+        values = list(range(size))
+        results = []
+        for build in (_level_order_tree, PackedBinaryTree.from_level_order):
+            gc.collect()
+            tracemalloc.start()
+            tree = build(values)
+            per_node = tracemalloc.get_traced_memory()[0] / size
+            tracemalloc.stop()
+            start_time = time.perf_counter()
+            gc.collect()
+            results.append((per_node, (time.perf_counter() - start_time) * 1e3))
+            del tree
+        (node_bytes, node_gc), (packed_bytes, packed_gc) = results
+        print(f"{size:>10} {node_bytes:>12.1f} {packed_bytes:>14.1f} {node_gc:>8.1f}ms {packed_gc:>8.1f}ms")
+    print("\nGC time is one full gc.collect() with the tree alive; typed arrays hold no objects for it to scan.")
+
+def benchmark_skewed_lookups(sizes=(10**4, 10**5, 10**6), queries=10**5, skew=1.1):
+    """Zipf-distributed lookups: SplayTree vs AVLTree vs dict"""
+    import itertools
+    import random
+
+    print(f"\n{'Keys':>10} {'SplayTree':>12} {'AVLTree':>12} {'dict':>12}   (µs per lookup, Zipf s={skew})")
+    for size in sizes:
+        keys = list(range(size))
+        hot_order = random.sample(keys, size)
+        weights = list(itertools.accumulate(1 / rank ** skew for rank in range(1, size + 1)))
+        lookups = random.choices(hot_order, cum_weights=weights, k=queries)
+
+        splay = SplayTree()
+        for key in random.sample(keys, size):
+            splay.insert(key)
+        avl = AVLTree.from_sorted(keys)
+        table = dict.fromkeys(keys)
+
+        timings = []
+        for lookup in (splay.search, avl.search, table.__contains__):
+            start_time = time.perf_counter()
+            for key in lookups:
+                lookup(key)
+            timings.append((time.perf_counter() - start_time) / queries * 1e6)
+        print(f"{size:>10} {timings[0]:>12.2f} {timings[1]:>12.2f} {timings[2]:>12.2f}")
+    print("\nSplayTree keeps hot keys a few levels from the root, but every access also rewrites pointers;")
+    print("in CPython those writes often cost more than the extra comparisons AVLTree makes.")
+
+TREE_BENCHMARKS = [
+    ("Level-order insert (BinaryTree vs CompleteBinaryTree)", benchmark_level_order_insert),
+    ("Search (BFS vs AVLTree vs bisect)", benchmark_search),
+    ("Ordered index (BPlusTree vs AVLTree vs dict)", benchmark_ordered_index),
+    ("Range queries (slices vs SegmentTree vs FenwickTree)", benchmark_range_queries),
+    ("Path prefix listing (dict scan vs PathTrie)", benchmark_path_prefix),
+    ("Tree loading (insert loop vs load vs lazy mmap load)", benchmark_tree_load),
+    ("Bulk build (AVLTree insert loop vs from_sorted)", benchmark_bulk_build),
+    ("Node storage (BinaryTree nodes vs PackedBinaryTree arrays)", benchmark_node_storage),
+    ("Skewed lookups (SplayTree vs AVLTree vs dict)", benchmark_skewed_lookups),
+]
+
+def tree_benchmark_menu():
+    print("\nPerformance Benchmarks:")
+    for i, (name, _) in enumerate(TREE_BENCHMARKS, 1):
+        print(f"{i}. {name}")
+    choice = input(f"\nChoose a benchmark (1-{len(TREE_BENCHMARKS)}): ")
+    if choice.isdigit() and 1 <= int(choice) <= len(TREE_BENCHMARKS):
+        TREE_BENCHMARKS[int(choice) - 1][1]()
+    else:
+        print("Invalid choice")
+
 def clear_screen():
     import os
     os.system('clear' if os.name == 'posix' else 'cls')
@@ -273,9 +2357,10 @@ def interactive_tree_learning():
         print("5. Quiz me!")
         print("6. Simulate file system")
         print("7. Guided Tutorial")
+        print("8. Performance benchmarks")
         print("0. Exit")
 
-        choice = input("\nChoose an operation (0-7): ")
+        choice = input("\nChoose an operation (0-8): ")
 
         if choice == "0":
             print("\nThanks for learning about binary trees! Keep practicing!")
@@ -309,8 +2394,8 @@ def interactive_tree_learning():
             tree = BinaryTree()
             try:
                 input_str = input("Enter numbers separated by spaces: ")
-                for x in input_str.split():
-                    tree.insert(int(x))
+                # Same level-order shape as repeated insert, linked in O(n)
+                tree = _level_order_tree([int(x) for x in input_str.split()])
                 print("\nCreated new tree!")
             except ValueError:
                 print("Please enter valid numbers separated by spaces")
@@ -348,9 +2433,23 @@ def interactive_tree_learning():
             print("\nDirectory Listing (using preorder traversal):")
             print(fs_tree.preorder_traversal())
 
+            fs_index = PathTrie()
+            for path in fs_tree.preorder_traversal():
+                fs_index.insert(path)
+            print("\nEverything under /home (PathTrie prefix lookup, O(k) to find the prefix):")
+            print([path for path, _ in fs_index.iter_prefix("/home")])
+            print(f"Entries under /usr: {fs_index.count('/usr')}")
+
+            print("\nAncestor queries (O(1) after one Euler-tour index build):")
+            print(f"Is /home an ancestor of /home/user2? {fs_tree.is_ancestor('/home', '/home/user2')}")
+            print(f"Common parent of /home/user1 and /usr/bin: {fs_tree.lowest_common_ancestor('/home/user1', '/usr/bin')}")
+
         elif choice == "7":
             guided_tree_tutorial()
 
+        elif choice == "8":
+            tree_benchmark_menu()
+
         input("\nPress Enter to continue...")
 
 if __name__ == "__main__":